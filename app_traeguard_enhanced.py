@@ -7,10 +7,14 @@ Enhanced version with dark/light mode, improved filtering, richer reports, and b
 import streamlit as st
 import pandas as pd
 import json
+import html
+import re
+import functools
 import sys
 import os
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from bisect import bisect_left
 
 # Import PlainText Panda agent
 try:
@@ -1140,6 +1144,8 @@ if 'reliability_results' not in st.session_state:
     st.session_state.reliability_results = None
 if 'rai_results' not in st.session_state:
     st.session_state.rai_results = None
+if 'rai_report_bytes' not in st.session_state:
+    st.session_state.rai_report_bytes = None
 if 'green_results' not in st.session_state:
     st.session_state.green_results = None
 if 'eco_mode' not in st.session_state:
@@ -1462,12 +1468,12 @@ def render_reliability_tab():
             with st.spinner("Running reliability tests..."):
                 try:
                     results = {}
+                    clauses = st.session_state.analysis_results.get('clauses', [])
                     
                     # Adversarial testing
                     if run_adversarial:
                         with st.spinner("Running adversarial tests..."):
                             tester = AdversarialTester()
-                            clauses = st.session_state.analysis_results.get('clauses', [])
                             adversarial_results = tester.run_robustness_suite(clauses)
                             results['adversarial'] = adversarial_results
                     
@@ -1475,7 +1481,6 @@ def render_reliability_tab():
                     if run_regression:
                         with st.spinner("Running regression tests..."):
                             regression_tester = RegressionTester()
-                            clauses = st.session_state.analysis_results.get('clauses', [])
                             regression_results = regression_tester.compare_with_baseline(clauses)
                             results['regression'] = regression_results
                     
@@ -1483,7 +1488,6 @@ def render_reliability_tab():
                     if run_cross_model:
                         with st.spinner("Running cross-model comparison..."):
                             cross_analyzer = CrossModelAnalyzer()
-                            clauses = st.session_state.analysis_results.get('clauses', [])
                             cross_results = cross_analyzer.summarize_cross_model_agreement(clauses)
                             results['cross_model'] = cross_results
                     
@@ -1494,93 +1498,113 @@ def render_reliability_tab():
                     st.error(f"Reliability testing failed: {str(e)}")
     
     # Display results
-    if st.session_state.reliability_results:
-        results = st.session_state.reliability_results
-        
-        # Unstable Clauses Section (Priority #1)
-        if 'adversarial' in results and results['adversarial'].get('unstable_clauses'):
-            st.subheader("⚠️ Unstable Clauses")
-            st.write("**Why this matters:** Unstable clauses indicate where the AI model's predictions are inconsistent when the text is slightly modified. This suggests these clauses may be ambiguous or the model may be uncertain about their classification.")
-            st.info("ℹ️ **Detection Criteria:** A clause is marked as unstable if either: (1) Risk drift score ≥ 0.3 (risk score changes significantly), OR (2) Label stability score ≤ 0.7 (model assigns different labels to similar text).")
-            
-            unstable_clauses = results['adversarial']['unstable_clauses']
+    results = st.session_state.reliability_results
+    if results is None:
+        return
+    if not results:
+        st.info("No tests selected.")
+        return
+    
+    _render_unstable_clauses(results)
+
+    st.divider()
+    
+    # Summary metrics with explanations
+    st.subheader("📊 Reliability Metrics")
+    
+    # Add explanations for each metric
+    st.info("ℹ️ **Understanding Reliability Metrics:** Each metric helps assess how stable and consistent the AI model's predictions are under different conditions.")
+    
+    # Create columns for different test results
+    test_items = list(results.items())
+    cols = st.columns(len(test_items))
+    
+    for i, (test_type, test_results) in enumerate(test_items):
+        with cols[i]:
+            if test_type == 'adversarial':
+                st.metric("Label Stability", f"{test_results.get('avg_label_stability', 0):.2f}")
+                st.caption("**What this means:** Measures how consistently the model assigns the same label to slightly modified versions of the same clause. Higher values (closer to 1.0) indicate more stable predictions.")
+                
+                st.metric("Risk Drift", f"{test_results.get('avg_risk_drift', 0):.2f}")
+                st.caption("**What this means:** Shows how much the risk score changes when the clause text is slightly modified. Lower values (closer to 0.0) indicate more stable risk assessment.")
+                
+                st.metric("Unstable Clauses", test_results.get('total_unstable', 0))
+                st.caption("**What this means:** Counts clauses where the model shows significant instability (risk drift ≥ 0.3 OR label stability ≤ 0.7). Fewer unstable clauses indicate better model reliability.")
             
-            if unstable_clauses:
-                for clause in unstable_clauses:
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="unstable-clause">
-                            <div style="margin-bottom: 0.75rem;">
-                                <strong>Original Text:</strong> {clause['original_text'][:200]}...
-                            </div>
-                            <div style="background: rgba(248, 81, 73, 0.1); border-left: 3px solid #f85149; padding: 0.5rem; margin: 0.5rem 0; border-radius: 0.25rem;">
-                                <strong>⚠️ Why this clause is unstable:</strong> This clause shows significant variation in risk scoring and/or label assignment when the text is slightly modified, indicating potential ambiguity or model uncertainty.
-                            </div>
-                            <div style="display: flex; gap: 2rem; margin-bottom: 0.5rem;">
-                                <div>
-                                    <strong>Label:</strong> {clause['original_label'].replace('_', ' ').title()}
-                                </div>
-                                <div>
-                                    <strong>Original Risk:</strong> {clause['original_risk']:.2f}
-                                </div>
-                            </div>
-                            <div style="display: flex; gap: 2rem;">
-                                <div>
-                                    <strong>Risk Drift:</strong> 
-                                    <span class="risk-high">{clause['risk_drift_score']:.2f}</span>
-                                </div>
-                                <div>
-                                    <strong>Label Stability:</strong> 
-                                    <span class="risk-medium">{clause['label_stability_score']:.2f}</span>
-                                </div>
-                            </div>
-                            <div style="margin-top: 0.5rem;">
-                                <span class="metric-badge">High Drift</span>
-                                <span class="metric-badge">Low Stability</span>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-            else:
-                st.success("✅ No unstable clauses detected for this policy based on current thresholds.")
-        else:
-            st.info("ℹ️ Run adversarial testing to identify unstable clauses")
-        
-        st.divider()
-        
-        # Summary metrics with explanations
-        st.subheader("📊 Reliability Metrics")
-        
-        # Add explanations for each metric
-        st.info("ℹ️ **Understanding Reliability Metrics:** Each metric helps assess how stable and consistent the AI model's predictions are under different conditions.")
-        
-        # Create columns for different test results
-        cols = st.columns(len(results))
-        
-        for i, (test_type, test_results) in enumerate(results.items()):
-            with cols[i]:
-                if test_type == 'adversarial':
-                    st.metric("Label Stability", f"{test_results.get('avg_label_stability', 0):.2f}")
-                    st.caption("**What this means:** Measures how consistently the model assigns the same label to slightly modified versions of the same clause. Higher values (closer to 1.0) indicate more stable predictions.")
-                    
-                    st.metric("Risk Drift", f"{test_results.get('avg_risk_drift', 0):.2f}")
-                    st.caption("**What this means:** Shows how much the risk score changes when the clause text is slightly modified. Lower values (closer to 0.0) indicate more stable risk assessment.")
-                    
-                    st.metric("Unstable Clauses", test_results.get('total_unstable', 0))
-                    st.caption("**What this means:** Counts clauses where the model shows significant instability (risk drift ≥ 0.3 OR label stability ≤ 0.7). Fewer unstable clauses indicate better model reliability.")
+            elif test_type == 'regression':
+                st.metric("Label Changes", f"{test_results.get('percent_label_changed', 0):.1f}%")
+                st.caption("**What this means:** Percentage of clauses where the model's label prediction changed compared to a baseline. Lower percentages indicate more consistent predictions over time.")
                 
-                elif test_type == 'regression':
-                    st.metric("Label Changes", f"{test_results.get('percent_label_changed', 0):.1f}%")
-                    st.caption("**What this means:** Percentage of clauses where the model's label prediction changed compared to a baseline. Lower percentages indicate more consistent predictions over time.")
-                    
-                    st.metric("Avg Risk Change", f"{test_results.get('avg_risk_change', 0):.3f}")
-                    st.caption("**What this means:** Average change in risk scores compared to baseline predictions. Smaller changes suggest the model maintains consistent risk assessment.")
+                st.metric("Avg Risk Change", f"{test_results.get('avg_risk_change', 0):.3f}")
+                st.caption("**What this means:** Average change in risk scores compared to baseline predictions. Smaller changes suggest the model maintains consistent risk assessment.")
+            
+            elif test_type == 'cross_model':
+                st.metric("Agreement Rate", f"{test_results.get('agreement_rate', 0):.1f}%")
+                st.caption("**What this means:** Percentage of clauses where different AI models agree on the classification. Higher agreement rates (above 80%) suggest reliable, consensus-based predictions.")
                 
-                elif test_type == 'cross_model':
-                    st.metric("Agreement Rate", f"{test_results.get('agreement_rate', 0):.1f}%")
-                    st.caption("**What this means:** Percentage of clauses where different AI models agree on the classification. Higher agreement rates (above 80%) suggest reliable, consensus-based predictions.")
-                    
-                    st.metric("Divergent Clauses", test_results.get('divergent_clauses_count', 0))
-                    st.caption("**What this means:** Number of clauses where models significantly disagree. Fewer divergent clauses indicate more reliable consensus across different AI approaches.")
+                st.metric("Divergent Clauses", test_results.get('divergent_clauses_count', 0))
+                st.caption("**What this means:** Number of clauses where models significantly disagree. Fewer divergent clauses indicate more reliable consensus across different AI approaches.")
+
+# Static markup for one unstable clause card; only the fields are substituted per clause
+_UNSTABLE_TMPL = """
+<div class="unstable-clause">
+<div style="margin-bottom: 0.75rem;">
+    <strong>Original Text:</strong> {original_text}...
+</div>
+<div style="background: rgba(248, 81, 73, 0.1); border-left: 3px solid #f85149; padding: 0.5rem; margin: 0.5rem 0; border-radius: 0.25rem;">
+    <strong>⚠️ Why this clause is unstable:</strong> This clause shows significant variation in risk scoring and/or label assignment when the text is slightly modified, indicating potential ambiguity or model uncertainty.
+</div>
+<div style="display: flex; gap: 2rem; margin-bottom: 0.5rem;">
+    <div>
+        <strong>Label:</strong> {label}
+    </div>
+    <div>
+        <strong>Original Risk:</strong> {original_risk:.2f}
+    </div>
+</div>
+<div style="display: flex; gap: 2rem;">
+    <div>
+        <strong>Risk Drift:</strong> 
+        <span class="risk-high">{risk_drift:.2f}</span>
+    </div>
+    <div>
+        <strong>Label Stability:</strong> 
+        <span class="risk-medium">{label_stability:.2f}</span>
+    </div>
+</div>
+<div style="margin-top: 0.5rem;">
+    <span class="metric-badge">High Drift</span>
+    <span class="metric-badge">Low Stability</span>
+</div>
+</div>
+"""
+
+def _render_unstable_clauses(results):
+    """Render the unstable clauses section of the reliability results."""
+    # Unstable Clauses Section (Priority #1)
+    if 'adversarial' in results and results['adversarial'].get('unstable_clauses'):
+        st.subheader("⚠️ Unstable Clauses")
+        st.write("**Why this matters:** Unstable clauses indicate where the AI model's predictions are inconsistent when the text is slightly modified. This suggests these clauses may be ambiguous or the model may be uncertain about their classification.")
+        st.info("ℹ️ **Detection Criteria:** A clause is marked as unstable if either: (1) Risk drift score ≥ 0.3 (risk score changes significantly), OR (2) Label stability score ≤ 0.7 (model assigns different labels to similar text).")
+        
+        unstable_clauses = results['adversarial']['unstable_clauses']
+        
+        if unstable_clauses:
+            html_parts = [
+                _UNSTABLE_TMPL.format(
+                    original_text=html.escape(clause['original_text'][:200]),
+                    label=clause['original_label'].replace('_', ' ').title(),
+                    original_risk=clause['original_risk'],
+                    risk_drift=clause['risk_drift_score'],
+                    label_stability=clause['label_stability_score']
+                )
+                for clause in unstable_clauses
+            ]
+            render_html("".join(html_parts))
+        else:
+            st.success("✅ No unstable clauses detected for this policy based on current thresholds.")
+    else:
+        st.info("ℹ️ Run adversarial testing to identify unstable clauses")
 
 def render_rai_tab():
     """Render the RAI Studio tab with enhanced report generation."""
@@ -1614,31 +1638,11 @@ def render_rai_tab():
         if st.button("🔍 Generate Explanations", type="primary"):
             with st.spinner("Generating RAI explanations..."):
                 try:
-                    explainer = RAIExplainer()
-                    report_generator = RAIReportGenerator()
-                    
                     clauses = st.session_state.analysis_results.get('clauses', [])
-                    explanations = []
-                    
-                    # Generate explanations for relevant clauses
-                    for clause in clauses:
-                        if clause.get('risk_score', 0) > 0.3:  # Lower threshold for more comprehensive analysis
-                            explanation = explainer.explain_clause(
-                                clause['text'],
-                                clause['label'],
-                                clause['risk_score'],
-                                user_type.lower().replace(" ", "_")
-                            )
-                            explanations.append(explanation)
-                    
-                    # Generate comprehensive report
-                    rai_report = report_generator.generate_report(
-                        explanations,
-                        user_context=user_type,
-                        all_clauses=clauses
-                    )
+                    rai_report = _generate_rai_report(clauses, user_type)
                     
                     st.session_state.rai_results = rai_report
+                    st.session_state.rai_report_bytes = rai_report['markdown'].encode('utf-8')
                     st.success("✅ RAI explanations generated!")
                     
                 except Exception as e:
@@ -1646,64 +1650,114 @@ def render_rai_tab():
     
     with col2:
         if st.session_state.rai_results:
-            report = st.session_state.rai_results
-            
-            st.subheader("📋 RAI Analysis Report")
-            
-            # Display overview
-            overview = report['structured']['overview']
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Clauses", overview['total_clauses'])
-            with col2:
-                st.metric("High Risk", overview['high_risk_clauses'])
-            with col3:
-                st.metric("Medium Risk", overview['medium_risk_clauses'])
-            with col4:
-                st.metric("Low Risk", overview['low_risk_clauses'])
-            
-            # Key themes
-            if report['structured']['key_themes']:
-                st.subheader("🎯 Key Themes Identified")
-                for theme in report['structured']['key_themes']:
-                    st.write(f"• {theme}")
-            
-            # High risk clauses
-            if report['structured']['high_risk_clauses']:
-                st.subheader("⚠️ High Risk Clauses")
-                for i, clause in enumerate(report['structured']['high_risk_clauses'], 1):
-                    with st.expander(f"Clause {i}: {clause['text'][:100]}..."):
-                        st.write(f"**Risk Score:** {clause['risk_score']:.2f}")
-                        st.write(f"**Explanation:** {clause['explanation']}")
-                        st.write(f"**Worst Case:** {clause['worst_case']}")
-                        if clause['vulnerable_groups']:
-                            st.write(f"**Vulnerable Groups:** {', '.join(clause['vulnerable_groups'])}")
-                        st.write(f"**Recommendation:** {clause['recommendation']}")
-            
-            # Recommendations
-            if report['structured']['recommendations']:
-                st.subheader("💡 Recommendations")
-                for i, rec in enumerate(report['structured']['recommendations'], 1):
-                    st.write(f"{i}. {rec}")
-            
-            # Summary
-            st.subheader("�� Summary")
-            st.write(report['structured']['summary'])
-            
-            # Report download
-            st.subheader("📄 Download Report")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.download_button(
-                    label="📥 Download Full Report",
-                    data=report['markdown'],
-                    file_name=f"traeguard_rai_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                    mime="text/markdown"
-                )
-            with col2:
-                if st.button("📋 Copy Report to Clipboard"):
-                    st.code(report['markdown'], language="markdown")
-                    st.success("Report copied to clipboard!")
+            _render_rai_report(st.session_state.rai_results)
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _explain_rai_clauses(clauses, user_type):
+    """Explain the relevant clauses (cached per input)."""
+    explainer = RAIExplainer()
+    explanations = []
+    
+    # Generate explanations for relevant clauses
+    for clause in clauses:
+        if clause.get('risk_score', 0) > 0.3:  # Lower threshold for more comprehensive analysis
+            explanation = explainer.explain_clause(
+                clause['text'],
+                clause['label'],
+                clause['risk_score'],
+                user_type.lower().replace(" ", "_")
+            )
+            explanations.append(explanation)
+    return explanations
+
+def _generate_rai_report(clauses, user_type):
+    """Build the RAI report; built fresh each time so its analysis date is current."""
+    return RAIReportGenerator().generate_report(
+        _explain_rai_clauses(clauses, user_type),
+        user_context=user_type,
+        all_clauses=clauses
+    )
+
+# Fragment: the download/copy buttons rerun only the report, not the whole tab
+@st.fragment
+def _render_rai_report(report):
+    """Render the generated RAI report."""
+    st.subheader("📋 RAI Analysis Report")
+    
+    # Display overview
+    overview = report['structured']['overview']
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Clauses", overview['total_clauses'])
+    with col2:
+        st.metric("High Risk", overview['high_risk_clauses'])
+    with col3:
+        st.metric("Medium Risk", overview['medium_risk_clauses'])
+    with col4:
+        st.metric("Low Risk", overview['low_risk_clauses'])
+    
+    # Key themes
+    if report['structured']['key_themes']:
+        st.subheader("🎯 Key Themes Identified")
+        st.markdown("\n".join(f"- {theme}" for theme in report['structured']['key_themes']))
+    
+    # High risk clauses
+    if report['structured']['high_risk_clauses']:
+        st.subheader("⚠️ High Risk Clauses")
+        for i, clause in enumerate(report['structured']['high_risk_clauses'], 1):
+            with st.expander(f"Clause {i}: {clause['text'][:100]}..."):
+                st.write(f"**Risk Score:** {clause['risk_score']:.2f}")
+                st.write(f"**Explanation:** {clause['explanation']}")
+                st.write(f"**Worst Case:** {clause['worst_case']}")
+                if clause['vulnerable_groups']:
+                    st.write(f"**Vulnerable Groups:** {', '.join(clause['vulnerable_groups'])}")
+                st.write(f"**Recommendation:** {clause['recommendation']}")
+    
+    # Recommendations
+    if report['structured']['recommendations']:
+        st.subheader("💡 Recommendations")
+        st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(report['structured']['recommendations'], 1)))
+    
+    # Summary
+    st.subheader("�� Summary")
+    st.write(report['structured']['summary'])
+    
+    # Report download
+    st.subheader("📄 Download Report")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="📥 Download Full Report",
+            data=st.session_state.rai_report_bytes,
+            file_name=f"traeguard_rai_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+            mime="text/markdown"
+        )
+    with col2:
+        if st.button("📋 Copy Report to Clipboard"):
+            st.code(report['markdown'], language="markdown")
+            st.success("Report copied to clipboard!")
+
+# Markdown control characters (plus Streamlit's $ math and :emoji:/:color[] syntax)
+_MD_SPECIAL = re.compile(r'([\\`*_{}\[\]()<>#+\-.!|~:$])')
+
+def _escape_markdown(text: str) -> str:
+    """Render text literally in Streamlit markdown, on a single line."""
+    return _MD_SPECIAL.sub(r'\\\1', " ".join(text.split()))
+
+# Icon per suggestion category (privacy coach and analysis labels)
+_CATEGORY_ICONS = {
+    'tracking': '🔍',
+    'data_sharing': '🔗',
+    'third_party_sharing': '🔗',
+    'data_retention': '🕒',
+    'long_term_retention': '🕒',
+    'data_collection': '📥',
+    'collection': '📥',
+    'sensitive': '⚠️',
+    'sensitive_collection': '⚠️',
+    'unclear_wording': '⚠️',
+    'invasive_permissions': '⚠️'
+}
 
 def render_privacy_coach_tab():
     st.header("🧭 Privacy Coach")
@@ -1733,12 +1787,12 @@ def render_privacy_coach_tab():
             st.subheader("Recommended Actions")
             suggestions = result.get('suggestions', [])
             for s in suggestions:
-                cat = s.get('category','general')
-                icon = '🔍' if cat in ['tracking'] else '🔗' if cat in ['data_sharing','third_party_sharing'] else '🕒' if cat in ['data_retention','long_term_retention'] else '📥' if cat in ['data_collection','collection'] else '⚠️' if cat in ['sensitive','sensitive_collection','unclear_wording','invasive_permissions'] else '✅'
+                icon = _CATEGORY_ICONS.get(s.get('category', 'general'), '✅')
                 st.write(f"- {icon} {s.get('text','')}")
                 ev = s.get('evidence')
                 if ev:
-                    st.caption(f"Because the policy says: \"{ev}\"")
+                    # Policy text is escaped so it renders literally
+                    st.caption(f"Because the policy says: \"{_escape_markdown(ev)}\"")
 
 def render_green_tab():
     """Render the Green Privacy tab with enhanced metrics and tooltips."""
@@ -1766,236 +1820,252 @@ def render_green_tab():
     
     # Display results
     if st.session_state.green_results:
-        result = st.session_state.green_results
-        
-        # Main footprint score with enhanced styling
-        col1, col2, col3 = st.columns([1, 2, 1])
-        
-        with col1:
-            with st.container():
-                st.write("**Data Categories**")
-                st.metric("Categories", result.data_categories_count)
-                st.caption("Different types of personal data collected")
-        
-        with col2:
-            # Large footprint score display
-            tier_class = f"tier-{result.tier.lower()}"
-            st.markdown(
-                f"""
-                <div style="text-align: center; margin: 1rem 0;">
-                    <div style="font-size: 4rem; {tier_class}">
-                        {result.tier_emoji} {result.data_footprint_score:.0f}
-                    </div>
-                    <div style="font-size: 1.5rem; {tier_class}; margin-top: 0.5rem;">
-                        {result.tier} Impact
-                    </div>
-                    <div style="color: var(--text-secondary); font-size: 0.9rem; margin-top: 0.5rem;">
-                        Environmental & Privacy Impact Score
-                    </div>
+        _render_green_results(st.session_state.green_results)
+
+# Static explainer text for the Quick Impact Overview expanders
+_DATA_TYPES_EXPLAIN = (
+    "**What this measures:** Number of different categories of personal data collected.\n\n"
+    "**Why it matters:** More data types generally mean higher privacy risk and larger environmental footprint."
+)
+_SHARING_EXPLAIN = (
+    "**What this measures:** Number of different types of third parties your data can be shared with.\n\n"
+    "**Why it matters:** More sharing increases privacy risk and data exposure."
+)
+_TRACKING_EXPLAIN = (
+    "**What this measures:** Use of cookies, trackers, device IDs, or fingerprinting.\n\n"
+    "**Why it matters:** Tracking can follow users across websites and build detailed profiles."
+)
+_RETENTION_EXPLAIN = (
+    "**What this measures:** How long your personal data can be retained.\n\n"
+    "**Why it matters:** Longer retention increases privacy risk and storage environmental impact."
+)
+
+@functools.lru_cache(maxsize=64)
+def _build_recommendations(tier, broker, granularity, tracking_count):
+    """Build the sustainability recommendations for a footprint result."""
+    recommendations = []
+    
+    if tier == "High":
+        recommendations.extend([
+            "🔴 **Critical:** Reduce data collection categories and implement data minimization",
+            "🔴 **Critical:** Establish clear data deletion policies and user deletion rights",
+            "🔴 **Critical:** Limit third-party data sharing and require explicit consent"
+        ])
+    elif tier == "Medium":
+        recommendations.extend([
+            "🟡 **Important:** Focus on reducing data categories and retention periods",
+            "🟡 **Important:** Provide granular consent options instead of blanket consent",
+            "🟡 **Important:** Reduce tracking technologies and offer opt-out options"
+        ])
+    else:
+        recommendations.extend([
+            "🟢 **Good:** Maintain current low-impact data practices",
+            "🟢 **Good:** Continue monitoring and improving privacy practices",
+            "🟢 **Good:** Consider implementing additional privacy-enhancing measures"
+        ])
+    
+    # Add specific recommendations based on metrics
+    if broker:
+        recommendations.append("⚠️ **Urgent:** Remove data broker sharing or provide explicit opt-in consent")
+    
+    if granularity == 'blanket':
+        recommendations.append("⚠️ **Important:** Replace blanket consent with granular, specific consent options")
+    
+    if tracking_count > 2:
+        recommendations.append("⚠️ **Important:** Reduce tracking technologies and provide clear opt-out mechanisms")
+    
+    return tuple(recommendations)
+
+def _render_green_results(result):
+    """Render the green footprint results."""
+    # Main footprint score with enhanced styling
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col1:
+        with st.container():
+            st.write("**Data Categories**")
+            st.metric("Categories", result.data_categories_count)
+            st.caption("Different types of personal data collected")
+    
+    with col2:
+        # Large footprint score display
+        tier_class = f"tier-{result.tier.lower()}"
+        render_html(
+            f"""
+            <div style="text-align: center; margin: 1rem 0;">
+                <div style="font-size: 4rem; {tier_class}">
+                    {result.tier_emoji} {result.data_footprint_score:.0f}
                 </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with col3:
-            with st.container():
-                st.write("**Retention Period**")
-                years = result.max_retention_days / 365
-                st.metric("Max Retention", f"{years:.1f} years" if years >= 1 else f"{result.max_retention_days} days")
-                st.caption("Longest data retention period")
-        
-        # Quick visual summary
-        st.subheader("📊 Quick Impact Overview")
-        
-        # Create a visual summary row
-        summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
-        
-        with summary_col1:
-            # Data categories visual
-            category_percentage = min(result.data_categories_count / 12, 1.0) * 100
-            st.metric("Data Types", f"{result.data_categories_count}/12")
-            st.progress(category_percentage / 100)
-            with st.expander("ℹ️ Details"):
-                st.write("**What this measures:** Number of different categories of personal data collected.")
-                st.write("**Why it matters:** More data types generally mean higher privacy risk and larger environmental footprint.")
-                st.write(f"**Your score:** {category_percentage:.0f}% of maximum concern")
-        
-        with summary_col2:
-            # Third-party sharing visual
-            sharing_percentage = min(result.third_party_count / 6, 1.0) * 100
-            st.metric("Sharing Partners", f"{result.third_party_count}/6")
-            st.progress(sharing_percentage / 100)
-            with st.expander("ℹ️ Details"):
-                st.write("**What this measures:** Number of different types of third parties your data can be shared with.")
-                st.write("**Why it matters:** More sharing increases privacy risk and data exposure.")
-                st.write(f"**Your score:** {sharing_percentage:.0f}% of maximum concern")
-        
-        with summary_col3:
-            # Tracking visual
-            tracking_percentage = min(result.tracking_count / 4, 1.0) * 100
-            st.metric("Tracking Methods", f"{result.tracking_count}/4")
-            st.progress(tracking_percentage / 100)
-            with st.expander("ℹ️ Details"):
-                st.write("**What this measures:** Use of cookies, trackers, device IDs, or fingerprinting.")
-                st.write("**Why it matters:** Tracking can follow users across websites and build detailed profiles.")
-                st.write(f"**Your score:** {tracking_percentage:.0f}% of maximum concern")
-        
-        with summary_col4:
-            # Retention visual
-            retention_percentage = min(result.max_retention_days / 1825, 1.0) * 100  # 5 years max
-            years_display = result.max_retention_days / 365
-            st.metric("Data Retention", f"{years_display:.1f}y")
-            st.progress(retention_percentage / 100)
-            with st.expander("ℹ️ Details"):
-                st.write("**What this measures:** How long your personal data can be retained.")
-                st.write("**Why it matters:** Longer retention increases privacy risk and storage environmental impact.")
-                st.write(f"**Your score:** {retention_percentage:.0f}% of maximum concern")
-        
-        # Enhanced metrics grid with collapsible details
-        st.subheader("📊 Detailed Footprint Metrics")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Data categories impact
-            with st.container():
-                st.write("**Data Categories Impact**")
-                category_score = min(result.data_categories_count / 12, 1.0) * 100
-                st.progress(category_score / 100)
-                st.write(f"{result.data_categories_count} categories detected")
-                with st.expander("ℹ️ Learn more"):
-                    st.write("How many different types of personal data this policy allows the company to collect. More categories usually mean a larger privacy and sustainability footprint.")
-            
-            # Third-party sharing
-            with st.container():
-                st.write("**Third-Party Sharing Impact**")
-                sharing_score = min(result.third_party_count / 6, 1.0) * 100
-                st.progress(sharing_score / 100)
-                st.write(f"{result.third_party_count} sharing mentions")
-                with st.expander("ℹ️ Learn more"):
-                    st.write("How many types of third parties your data can be shared with. More sharing increases risk and complexity.")
-            
-            # Tracking technologies
-            with st.container():
-                st.write("**Tracking Technologies**")
-                tracking_score = min(result.tracking_count / 4, 1.0) * 100
-                st.progress(tracking_score / 100)
-                st.write(f"{result.tracking_count} tracking mentions")
-                with st.expander("ℹ️ Learn more"):
-                    st.write("Use of cookies, trackers, or device IDs which can follow users across sites and sessions.")
-        
-        with col2:
-            # Retention impact
-            with st.container():
-                st.write("**Retention Impact**")
-                retention_score = min(result.max_retention_days / 1825, 1.0) * 100
-                st.progress(retention_score / 100)
-                years = result.max_retention_days / 365
-                st.write(f"Up to {years:.1f} years retention")
-                with st.expander("ℹ️ Learn more"):
-                    st.write("How long your data can be stored. Longer storage increases both privacy risk and energy/storage impact.")
-            
-            # Data broker mentions
-            with st.container():
-                st.write("**Data Broker Activity**")
-                broker_score = 100 if result.data_broker_mention else 0
-                st.progress(broker_score / 100)
-                st.write("Data broker mentioned" if result.data_broker_mention else "No data broker mention")
-                with st.expander("ℹ️ Learn more"):
-                    st.write("Whether data is shared or sold to data brokers/advertisers, significantly increasing privacy risk.")
-            
-            # Consent granularity
-            with st.container():
-                st.write("**Consent Granularity**")
-                consent_score = 100 if result.consent_granularity == 'granular' else 50 if result.consent_granularity == 'mixed' else 0
-                st.progress(consent_score / 100)
-                st.write(f"{result.consent_granularity.title()} consent")
-                with st.expander("ℹ️ Learn more"):
-                    st.write("Single blanket consent vs granular opt-outs. Granular consent gives users more control over their data.")
-        
-        # Eco mode optimizations
-        if result.eco_mode_applied and result.optimizations_applied:
-            st.subheader("⚡ Eco-Mode Optimizations Applied")
-            
-            for optimization in result.optimizations_applied:
-                st.write(f"✅ {optimization}")
-            
-            st.info("💡 Eco-mode reduces computational overhead while maintaining core analysis quality")
-        
-        # Recommendations with enhanced styling
-        st.subheader("💡 Sustainability & Privacy Recommendations")
-        
-        recommendations = []
-        
-        if result.tier == "High":
-            recommendations.extend([
-                "🔴 **Critical:** Reduce data collection categories and implement data minimization",
-                "🔴 **Critical:** Establish clear data deletion policies and user deletion rights",
-                "🔴 **Critical:** Limit third-party data sharing and require explicit consent"
-            ])
-        elif result.tier == "Medium":
-            recommendations.extend([
-                "🟡 **Important:** Focus on reducing data categories and retention periods",
-                "🟡 **Important:** Provide granular consent options instead of blanket consent",
-                "🟡 **Important:** Reduce tracking technologies and offer opt-out options"
-            ])
-        else:
-            recommendations.extend([
-                "🟢 **Good:** Maintain current low-impact data practices",
-                "🟢 **Good:** Continue monitoring and improving privacy practices",
-                "🟢 **Good:** Consider implementing additional privacy-enhancing measures"
-            ])
-        
-        # Add specific recommendations based on metrics
-        if result.data_broker_mention:
-            recommendations.append("⚠️ **Urgent:** Remove data broker sharing or provide explicit opt-in consent")
-        
-        if result.consent_granularity == 'blanket':
-            recommendations.append("⚠️ **Important:** Replace blanket consent with granular, specific consent options")
+                <div style="font-size: 1.5rem; {tier_class}; margin-top: 0.5rem;">
+                    {result.tier} Impact
+                </div>
+                <div style="color: var(--text-secondary); font-size: 0.9rem; margin-top: 0.5rem;">
+                    Environmental & Privacy Impact Score
+                </div>
+            </div>
+            """
+        )
+    
+    with col3:
+        with st.container():
+            st.write("**Retention Period**")
+            years = result.max_retention_days / 365
+            st.metric("Max Retention", f"{years:.1f} years" if years >= 1 else f"{result.max_retention_days} days")
+            st.caption("Longest data retention period")
+    
+    # Quick visual summary
+    st.subheader("📊 Quick Impact Overview")
+    
+    # Create a visual summary row
+    summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
+    
+    with summary_col1:
+        # Data categories visual
+        category_percentage = min(result.data_categories_count / 12, 1.0) * 100
+        st.metric("Data Types", f"{result.data_categories_count}/12")
+        st.progress(category_percentage / 100)
+        with st.expander("ℹ️ Details"):
+            st.markdown(f"{_DATA_TYPES_EXPLAIN}\n\n**Your score:** {category_percentage:.0f}% of maximum concern")
+    
+    with summary_col2:
+        # Third-party sharing visual
+        sharing_percentage = min(result.third_party_count / 6, 1.0) * 100
+        st.metric("Sharing Partners", f"{result.third_party_count}/6")
+        st.progress(sharing_percentage / 100)
+        with st.expander("ℹ️ Details"):
+            st.markdown(f"{_SHARING_EXPLAIN}\n\n**Your score:** {sharing_percentage:.0f}% of maximum concern")
+    
+    with summary_col3:
+        # Tracking visual
+        tracking_percentage = min(result.tracking_count / 4, 1.0) * 100
+        st.metric("Tracking Methods", f"{result.tracking_count}/4")
+        st.progress(tracking_percentage / 100)
+        with st.expander("ℹ️ Details"):
+            st.markdown(f"{_TRACKING_EXPLAIN}\n\n**Your score:** {tracking_percentage:.0f}% of maximum concern")
+    
+    with summary_col4:
+        # Retention visual
+        retention_percentage = min(result.max_retention_days / 1825, 1.0) * 100  # 5 years max
+        years_display = result.max_retention_days / 365
+        st.metric("Data Retention", f"{years_display:.1f}y")
+        st.progress(retention_percentage / 100)
+        with st.expander("ℹ️ Details"):
+            st.markdown(f"{_RETENTION_EXPLAIN}\n\n**Your score:** {retention_percentage:.0f}% of maximum concern")
+    
+    # Enhanced metrics grid with collapsible details
+    st.subheader("📊 Detailed Footprint Metrics")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Data categories impact
+        with st.container():
+            st.write("**Data Categories Impact**")
+            category_score = min(result.data_categories_count / 12, 1.0) * 100
+            st.progress(category_score / 100)
+            st.write(f"{result.data_categories_count} categories detected")
+            with st.expander("ℹ️ Learn more"):
+                st.write("How many different types of personal data this policy allows the company to collect. More categories usually mean a larger privacy and sustainability footprint.")
+        
+        # Third-party sharing
+        with st.container():
+            st.write("**Third-Party Sharing Impact**")
+            sharing_score = min(result.third_party_count / 6, 1.0) * 100
+            st.progress(sharing_score / 100)
+            st.write(f"{result.third_party_count} sharing mentions")
+            with st.expander("ℹ️ Learn more"):
+                st.write("How many types of third parties your data can be shared with. More sharing increases risk and complexity.")
+        
+        # Tracking technologies
+        with st.container():
+            st.write("**Tracking Technologies**")
+            tracking_score = min(result.tracking_count / 4, 1.0) * 100
+            st.progress(tracking_score / 100)
+            st.write(f"{result.tracking_count} tracking mentions")
+            with st.expander("ℹ️ Learn more"):
+                st.write("Use of cookies, trackers, or device IDs which can follow users across sites and sessions.")
+    
+    with col2:
+        # Retention impact
+        with st.container():
+            st.write("**Retention Impact**")
+            retention_score = min(result.max_retention_days / 1825, 1.0) * 100
+            st.progress(retention_score / 100)
+            years = result.max_retention_days / 365
+            st.write(f"Up to {years:.1f} years retention")
+            with st.expander("ℹ️ Learn more"):
+                st.write("How long your data can be stored. Longer storage increases both privacy risk and energy/storage impact.")
+        
+        # Data broker mentions
+        with st.container():
+            st.write("**Data Broker Activity**")
+            broker_score = 100 if result.data_broker_mention else 0
+            st.progress(broker_score / 100)
+            st.write("Data broker mentioned" if result.data_broker_mention else "No data broker mention")
+            with st.expander("ℹ️ Learn more"):
+                st.write("Whether data is shared or sold to data brokers/advertisers, significantly increasing privacy risk.")
+        
+        # Consent granularity
+        with st.container():
+            st.write("**Consent Granularity**")
+            consent_score = 100 if result.consent_granularity == 'granular' else 50 if result.consent_granularity == 'mixed' else 0
+            st.progress(consent_score / 100)
+            st.write(f"{result.consent_granularity.title()} consent")
+            with st.expander("ℹ️ Learn more"):
+                st.write("Single blanket consent vs granular opt-outs. Granular consent gives users more control over their data.")
+    
+    # Eco mode optimizations
+    if result.eco_mode_applied and result.optimizations_applied:
+        st.subheader("⚡ Eco-Mode Optimizations Applied")
         
-        if result.tracking_count > 2:
-            recommendations.append("⚠️ **Important:** Reduce tracking technologies and provide clear opt-out mechanisms")
+        st.markdown("\n\n".join(f"✅ {optimization}" for optimization in result.optimizations_applied))
         
-        for rec in recommendations:
-            st.write(rec)
+        st.info("💡 Eco-mode reduces computational overhead while maintaining core analysis quality")
+    
+    # Recommendations with enhanced styling
+    st.subheader("💡 Sustainability & Privacy Recommendations")
+    
+    recommendations = _build_recommendations(
+        result.tier,
+        result.data_broker_mention,
+        result.consent_granularity,
+        result.tracking_count
+    )
+    
+    st.markdown("\n\n".join(recommendations))
+
 
 # Helper functions
+def render_html(markup: str):
+    """Render raw HTML, skipping the markdown parser when st.html is available."""
+    if hasattr(st, "html"):
+        st.html(markup)
+    else:
+        # Older Streamlit releases without st.html
+        st.markdown(markup, unsafe_allow_html=True)
+
+# Risk bands: scores above each bound move up one band (Low / Medium / High)
+_RISK_BOUNDS = (0.4, 0.7)
+_RISK_LABELS = ("Low", "Medium", "High")
+_RISK_CLASSES = ("risk-low", "risk-medium", "risk-high")
+_SEVERITY_CLASSES = {"high": "risk-high", "medium": "risk-medium"}
+_SEVERITY_SORT_KEYS = {"High": 3, "Medium": 2}
+
 def get_risk_severity(risk_score: float) -> str:
     """Get risk severity level."""
-    if risk_score > 0.7:
-        return "High"
-    elif risk_score > 0.4:
-        return "Medium"
-    else:
-        return "Low"
+    return _RISK_LABELS[bisect_left(_RISK_BOUNDS, risk_score)]
 
 def get_risk_class(risk_score: float) -> str:
     """Get CSS class for risk score."""
-    if risk_score > 0.7:
-        return "risk-high"
-    elif risk_score > 0.4:
-        return "risk-medium"
-    else:
-        return "risk-low"
+    return _RISK_CLASSES[bisect_left(_RISK_BOUNDS, risk_score)]
 
 def get_severity_class(severity: str) -> str:
     """Get CSS class for severity."""
-    severity_lower = severity.lower()
-    if severity_lower == "high":
-        return "risk-high"
-    elif severity_lower == "medium":
-        return "risk-medium"
-    else:
-        return "risk-low"
+    return _SEVERITY_CLASSES.get(severity.lower(), "risk-low")
 
 def get_severity_sort_key(severity: str) -> int:
     """Get sort key for severity (High > Medium > Low)."""
-    if severity == "High":
-        return 3
-    elif severity == "Medium":
-        return 2
-    else:
-        return 1
+    return _SEVERITY_SORT_KEYS.get(severity, 1)
 
 if __name__ == "__main__":
     main()
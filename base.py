@@ -3,15 +3,31 @@ Base classes and utilities for TraeGuard modules
 """
 import time
 import json
+import hashlib
 import logging
+import threading
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict, deque
+
+# Optional fast JSON encoder; fall back to the stdlib json module
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _field_names(cls) -> tuple:
+    """Field names of a result dataclass, computed once per class"""
+    return tuple(f.name for f in fields(cls))
+
 @dataclass
 class AnalysisResult:
     """Base class for all analysis results"""
@@ -22,10 +38,14 @@ class AnalysisResult:
     metadata: Dict[str, Any]
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shallow conversion: asdict() would deep-copy every nested container
+        return {name: getattr(self, name) for name in _field_names(type(self))}
     
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2)
+        if orjson is not None:
+            # orjson serializes dataclasses natively, no intermediate dict needed
+            return orjson.dumps(self, default=_json_default, option=_ORJSON_OPTIONS).decode()
+        return json.dumps(self.to_dict(), default=_json_default, indent=2)
 
 @dataclass
 class ReliabilityResult(AnalysisResult):
@@ -69,89 +89,155 @@ class BaseAnalyzer(ABC):
         """Validate input text"""
         if not text or not isinstance(text, str):
             return False
-        if len(text.strip()) < 10:  # Minimum meaningful text length
+        # Minimum meaningful text length, ignoring surrounding whitespace.
+        # Walk in from both ends rather than text.strip(), which copies the whole text.
+        n = len(text)
+        if n < 10:
             return False
-        return True
+        left = 0
+        while left < n and text[left].isspace():
+            left += 1
+        right = n
+        while right > left and text[right - 1].isspace():
+            right -= 1
+        return right - left >= 10
     
     def log_analysis_start(self, text: str, **kwargs):
         """Log analysis start"""
-        self.logger.info(f"Starting {self.name} analysis for text of length {len(text)}")
+        self.logger.info("Starting %s analysis for text of length %d", self.name, len(text))
         
     def log_analysis_complete(self, duration: float, status: str):
         """Log analysis completion"""
-        self.logger.info(f"Completed {self.name} analysis in {duration:.2f}s with status: {status}")
+        self.logger.info("Completed %s analysis in %.2fs with status: %s", self.name, duration, status)
+
+# Per-metric history cap, so long-running processes don't grow without bound
+MAX_METRIC_HISTORY = 10000
 
 class MetricsCollector:
-    """Utility class for collecting and aggregating metrics"""
+    """Utility class for collecting and aggregating metrics (thread-safe)"""
     
     def __init__(self):
-        self.metrics = {}
+        # Bounded history per metric (the last MAX_METRIC_HISTORY records)
+        self.metrics = defaultdict(lambda: deque(maxlen=MAX_METRIC_HISTORY))
+        # Running count/sum/min/max/latest of numeric values per metric, over
+        # every value ever recorded (not just the capped history)
+        self._stats = {}
+        # Last exported stats per metric, recomputed only after new records
+        self._stats_cache = {}
+        self._dirty = set()
+        # Guards history creation/appends and the stats accumulators
+        self._lock = threading.Lock()
         
     def record_metric(self, name: str, value: Any, metadata: Dict[str, Any] = None):
         """Record a metric with optional metadata"""
-        if name not in self.metrics:
-            self.metrics[name] = []
-        
         metric_entry = {
             "timestamp": time.time(),
             "value": value,
             "metadata": metadata or {}
         }
-        self.metrics[name].append(metric_entry)
+        
+        with self._lock:
+            self.metrics[name].append(metric_entry)
+            
+            if isinstance(value, (int, float)):
+                self._dirty.add(name)
+                stats = self._stats.get(name)
+                if stats is None:
+                    self._stats[name] = {"count": 1, "sum": value, "min": value, "max": value, "latest": value}
+                else:
+                    stats["count"] += 1
+                    stats["sum"] += value
+                    if value < stats["min"]:
+                        stats["min"] = value
+                    if value > stats["max"]:
+                        stats["max"] = value
+                    stats["latest"] = value
     
     def get_metric_stats(self, name: str) -> Dict[str, Any]:
-        """Get statistics for a metric"""
-        if name not in self.metrics or not self.metrics[name]:
-            return {}
-        
-        values = [entry["value"] for entry in self.metrics[name] if isinstance(entry["value"], (int, float))]
-        if not values:
-            return {}
+        """Get statistics for a metric.
         
-        return {
-            "count": len(values),
-            "mean": sum(values) / len(values),
-            "min": min(values),
-            "max": max(values),
-            "latest": values[-1]
-        }
+        Stats are lifetime totals over every numeric value recorded, including
+        records already dropped from the capped history in self.metrics.
+        """
+        with self._lock:
+            if name not in self._dirty and name in self._stats_cache:
+                return dict(self._stats_cache[name])
+            
+            stats = self._stats.get(name)
+            if not stats:
+                return {}
+            
+            result = {
+                "count": stats["count"],
+                "mean": stats["sum"] / stats["count"],
+                "min": stats["min"],
+                "max": stats["max"],
+                "latest": stats["latest"]
+            }
+            self._stats_cache[name] = result
+            self._dirty.discard(name)
+            return dict(result)
     
     def export_metrics(self) -> Dict[str, Any]:
         """Export all metrics"""
+        with self._lock:
+            names = list(self.metrics)
         return {
             name: self.get_metric_stats(name) 
-            for name in self.metrics.keys()
+            for name in names
         }
 
 class CacheManager:
-    """Simple in-memory cache for analysis results"""
+    """Simple in-memory LRU cache for analysis results with adaptive per-entry TTL"""
     
-    def __init__(self, max_size: int = 1000, ttl: int = 3600):
-        self.cache = {}
+    def __init__(self, max_size: int = 1000, ttl: int = 3600, min_ttl: Optional[int] = None):
+        self.cache = OrderedDict()
         self.max_size = max_size
         self.ttl = ttl
+        # Idle lifetime of a never-hit entry; defaults to ttl (no adaptive shortening)
+        self.min_ttl = ttl if min_ttl is None else min_ttl
+        
+    def _effective_ttl(self, entry: Dict[str, Any]) -> float:
+        """TTL for an entry, scaled from how long it has stayed in use.
         
+        Entries that are never hit expire after min_ttl; entries that keep
+        getting hit earn twice their observed active lifetime, up to ttl.
+        Regardless of hits, no entry outlives ttl from its creation (see get).
+        """
+        return min(self.ttl, max(self.min_ttl, (entry["last_hit"] - entry["timestamp"]) * 2))
+    
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache"""
         if key in self.cache:
             entry = self.cache[key]
-            if time.time() - entry["timestamp"] < self.ttl:
+            now = time.time()
+            # Idle expiry is adaptive, but ttl from creation is a hard cap
+            if (now - entry["timestamp"] < self.ttl
+                    and now - entry["last_hit"] < self._effective_ttl(entry)):
+                entry["last_hit"] = now
+                self.cache.move_to_end(key)
                 return entry["value"]
             else:
                 del self.cache[key]
         return None
     
     def set(self, key: str, value: Any):
-        """Set item in cache with TTL"""
-        # Simple LRU eviction
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k]["timestamp"])
-            del self.cache[oldest_key]
+        """Set item in cache with TTL.
+        
+        The value is stored by reference and handed out as-is on hits; callers
+        must not mutate results they get from the cache.
+        """
+        # LRU eviction: least recently used entry is at the front
+        if key not in self.cache and len(self.cache) >= self.max_size:
+            self.cache.popitem(last=False)
         
+        now = time.time()
         self.cache[key] = {
             "value": value,
-            "timestamp": time.time()
+            "timestamp": now,
+            "last_hit": now
         }
+        self.cache.move_to_end(key)
     
     def clear(self):
         """Clear all cache entries"""
@@ -159,15 +245,28 @@ class CacheManager:
 
 def create_cache_key(text: str, analysis_type: str, **kwargs) -> str:
     """Create a cache key for analysis results"""
-    # Simple hash-based key (could be improved with more sophisticated hashing)
-    text_hash = hash(text.strip().lower())
-    kwargs_str = "_".join(f"{k}_{v}" for k, v in sorted(kwargs.items()))
+    # Stable digest (unlike hash(), identical across processes); fold case on the
+    # str so non-ASCII text normalizes as before
+    text_bytes = text.strip().lower().encode("utf-8", "ignore")
+    text_hash = hashlib.blake2b(text_bytes, digest_size=16).hexdigest()
+    kwargs_str = "|".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
     return f"{analysis_type}_{text_hash}_{kwargs_str}"
 
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for types json/orjson don't handle natively"""
+    if isinstance(obj, AnalysisResult):
+        return obj.to_dict()
+    if hasattr(obj, "tolist"):
+        # NumPy scalars/arrays, as orjson's OPT_SERIALIZE_NUMPY emits them
+        return obj.tolist()
+    return str(obj)
+
 def safe_json_serialize(obj: Any) -> str:
     """Safely serialize objects to JSON"""
     try:
-        return json.dumps(obj, default=str, indent=2)
+        if orjson is not None:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode()
+        return json.dumps(obj, default=_json_default, indent=2)
     except (TypeError, ValueError) as e:
-        logger.warning(f"JSON serialization failed: {e}")
+        logger.warning("JSON serialization failed: %s", e)
         return json.dumps({"error": "Serialization failed", "type": str(type(obj))})
\ No newline at end of file
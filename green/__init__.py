@@ -2,25 +2,22 @@
 Green Privacy: Environmental impact assessment and eco optimization for privacy analysis
 """
 
-# Import only available submodules to avoid deployment errors
-try:
-    from . import footprint
-except Exception:
-    footprint = None
+import importlib
+import importlib.util
 
-# Optional modules (may not exist in minimal deployments)
-try:
-    from . import carbon
-except Exception:
-    carbon = None
+# Submodules are imported on first attribute access (PEP 562) to keep package import cheap
+_SUBMODULES = ("footprint", "carbon", "eco_mode")
 
-try:
-    from . import eco_mode
-except Exception:
-    eco_mode = None
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # Optional modules (may not exist in minimal deployments)
+        try:
+            module = importlib.import_module(f".{name}", __name__)
+        except Exception:
+            module = None
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = [name for name, mod in {
-    "footprint": footprint,
-    "carbon": carbon,
-    "eco_mode": eco_mode
-}.items() if mod is not None]
\ No newline at end of file
+# Only advertise submodules that are present, without importing them
+__all__ = [name for name in _SUBMODULES if importlib.util.find_spec(f".{name}", __name__) is not None]
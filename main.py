@@ -7,7 +7,9 @@ integrating Reliability Lab, RAI Studio, and Green Privacy modules.
 
 import logging
 from typing import Dict, List, Any, Optional
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Import base classes and utilities
 from .base import BaseAnalyzer, AnalysisResult, MetricsCollector, CacheManager
@@ -18,6 +20,7 @@ try:
     import config
     TRAEGUARD_ENABLED = config.TRAEGUARD_ENABLED
 except (ImportError, AttributeError):
+    config = None
     TRAEGUARD_ENABLED = False
     logging.warning("TraeGuard configuration not available. Some features may be limited.")
 
@@ -34,7 +37,7 @@ class TraeGuardOrchestrator:
     def __init__(self, enable_caching: bool = True):
         self.enable_caching = enable_caching
         self.metrics_collector = MetricsCollector()
-        self.cache_manager = CacheManager(max_size=1000, ttl=3600) if enable_caching else None
+        self.cache_manager = CacheManager(max_size=1000, ttl=3600, min_ttl=300) if enable_caching else None
         self.analyzers = {}
         
         # Initialize analyzers if TraeGuard is enabled
@@ -59,9 +62,15 @@ class TraeGuardOrchestrator:
             logger.info("Successfully initialized TraeGuard analyzers")
             
         except Exception as e:
-            logger.error(f"Failed to initialize analyzers: {e}")
+            logger.error("Failed to initialize analyzers: %s", e)
             self.analyzers = {}
     
+    def _run_analyzer(self, name: str, policy_text: str, **kwargs):
+        """Run a single analyzer, returning its result and own duration in seconds"""
+        t_start = time.perf_counter()
+        analysis_result = self.analyzers[name].analyze(policy_text, **kwargs)
+        return analysis_result, time.perf_counter() - t_start
+    
     def analyze_policy(self, policy_text: str, 
                       enable_reliability: bool = True,
                       enable_rai: bool = True,
@@ -80,7 +89,8 @@ class TraeGuardOrchestrator:
         Returns:
             Dictionary containing all analysis results
         """
-        start_time = datetime.now()
+        t0 = time.perf_counter()
+        started_iso = datetime.now().isoformat()
         
         # Check cache first
         if self.cache_manager:
@@ -93,10 +103,13 @@ class TraeGuardOrchestrator:
                 logger.info("Returning cached TraeGuard analysis result")
                 return cached_result
         
-        logger.info(f"Starting TraeGuard analysis (reliability={enable_reliability}, rai={enable_rai}, green={enable_green})")
+        logger.info(
+            "Starting TraeGuard analysis (reliability=%s, rai=%s, green=%s)",
+            enable_reliability, enable_rai, enable_green
+        )
         
         results = {
-            "timestamp": start_time.isoformat(),
+            "timestamp": started_iso,
             "policy_length": len(policy_text),
             "traeguard_version": getattr(config, 'TRAEGUARD_VERSION', '1.0.0'),
             "analyses": {},
@@ -108,47 +121,44 @@ class TraeGuardOrchestrator:
             }
         }
         
-        # Run enabled analyses
-        if enable_reliability and 'reliability' in self.analyzers:
-            try:
-                reliability_result = self.analyzers['reliability'].analyze(policy_text, **kwargs)
-                results["analyses"]["reliability"] = reliability_result.to_dict()
-                self.metrics_collector.record_metric("reliability_analysis_time", 
-                                                   (datetime.now() - start_time).total_seconds())
-            except Exception as e:
-                logger.error(f"Reliability analysis failed: {e}")
-                results["analyses"]["reliability"] = {"error": str(e), "status": "failed"}
-        
-        if enable_rai and 'rai' in self.analyzers:
-            try:
-                rai_result = self.analyzers['rai'].analyze(policy_text, **kwargs)
-                results["analyses"]["rai"] = rai_result.to_dict()
-                self.metrics_collector.record_metric("rai_analysis_time", 
-                                                   (datetime.now() - start_time).total_seconds())
-            except Exception as e:
-                logger.error(f"RAI analysis failed: {e}")
-                results["analyses"]["rai"] = {"error": str(e), "status": "failed"}
-        
-        if enable_green and 'green' in self.analyzers:
-            try:
-                green_result = self.analyzers['green'].analyze(policy_text, **kwargs)
-                results["analyses"]["green"] = green_result.to_dict()
-                self.metrics_collector.record_metric("green_analysis_time", 
-                                                   (datetime.now() - start_time).total_seconds())
-            except Exception as e:
-                logger.error(f"Green analysis failed: {e}")
-                results["analyses"]["green"] = {"error": str(e), "status": "failed"}
+        # Run enabled analyses concurrently; they share only the input text
+        tasks = [
+            name for name, enabled in (("reliability", enable_reliability),
+                                       ("rai", enable_rai),
+                                       ("green", enable_green))
+            if enabled and name in self.analyzers
+        ]
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [
+                    (name, executor.submit(self._run_analyzer, name, policy_text, **kwargs))
+                    for name in tasks
+                ]
+                # Collect in submission order so results["analyses"] keeps a stable key order
+                for name, future in futures:
+                    try:
+                        analysis_result, elapsed = future.result()
+                        results["analyses"][name] = analysis_result.to_dict()
+                        self.metrics_collector.record_metric(f"{name}_analysis_time", elapsed)
+                    except Exception as e:
+                        logger.error("%s analysis failed: %s", name, e)
+                        results["analyses"][name] = {"error": str(e), "status": "failed"}
         
         # Add overall metrics
-        total_time = (datetime.now() - start_time).total_seconds()
+        total_time = time.perf_counter() - t0
         results["metadata"]["total_analysis_time"] = total_time
-        results["metadata"]["completed_analyses"] = len([a for a in results["analyses"].values() if a.get("status") == "success"])
+        results["metadata"]["completed_analyses"] = sum(
+            1 for a in results["analyses"].values() if a.get("status") == "success"
+        )
         
         # Cache the result
         if self.cache_manager:
             self.cache_manager.set(cache_key, results)
         
-        logger.info(f"TraeGuard analysis completed in {total_time:.2f}s")
+        logger.info(
+            "TraeGuard analysis completed in %.2fs (%d/%d analyses succeeded)",
+            total_time, results["metadata"]["completed_analyses"], len(results["analyses"])
+        )
         return results
     
     def get_metrics(self) -> Dict[str, Any]:
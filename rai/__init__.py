@@ -2,9 +2,16 @@
 RAI Studio: Responsible AI explanations, beneficiary analysis, and vulnerable group impact assessment
 """
 
-from . import explainability
-from . import beneficiary
-from . import vulnerable
-from . import external_llm
+import importlib
 
-__all__ = ["explainability", "beneficiary", "vulnerable", "external_llm"]
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562) to keep package import cheap
+_SUBMODULES = ("explainability", "beneficiary", "vulnerable", "external_llm")
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = list(_SUBMODULES)
@@ -2,9 +2,16 @@
 Reliability Lab: Adversarial testing, robustness evaluation, and cross-model validation
 """
 
-from . import adversarial
-from . import robustness
-from . import cross_model
-from . import regression
+import importlib
 
-__all__ = ["adversarial", "robustness", "cross_model", "regression"]
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562) to keep package import cheap
+_SUBMODULES = ("adversarial", "robustness", "cross_model", "regression")
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = list(_SUBMODULES)
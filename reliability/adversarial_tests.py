@@ -6,12 +6,14 @@ by generating semantic variants and measuring classifier stability.
 """
 
 import re
-import random
+import hashlib
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import threading
 
 # Import existing PrivyReveal components
 import sys
@@ -24,8 +26,101 @@ from config import THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# Slotted result objects (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Reverse index of id2label, for O(1) lookup of a label's probability column
+_LABEL2IDX = {label: i for i, label in enumerate(id2label.values())}
+
+# LRU cache of classifier outputs keyed by text digest:
+# digest -> (top1_label, rating, case_score, confidence, top3, probability_distribution)
+_CLASSIFICATION_CACHE = OrderedDict()
+_CACHE_LIMIT = 4096
+_CACHE_LOCK = threading.Lock()
+
+
+def set_cache_limit(n: int) -> None:
+    """Set the maximum number of cached classifications, evicting LRU entries."""
+    global _CACHE_LIMIT
+    with _CACHE_LOCK:
+        _CACHE_LIMIT = max(0, int(n))
+        while len(_CLASSIFICATION_CACHE) > _CACHE_LIMIT:
+            _CLASSIFICATION_CACHE.popitem(last=False)
+
+
+# Precompiled patterns used by the variant generators
+_RE_WE_VERB = re.compile(r'we (\w+)')
+_RE_YOUR = re.compile(r'your (\w+)')
+_RE_WILL = re.compile(r'\bwill\b', re.IGNORECASE)
+_RE_NO_LONGER = re.compile(r'\bno\s+longer\b', re.IGNORECASE)
+_RE_DAYS = re.compile(r'\b\d+\s+days?\b', re.IGNORECASE)
+_RE_WEEKS = re.compile(r'\b\d+\s+weeks?\b', re.IGNORECASE)
+_RE_MONTHS = re.compile(r'\b\d+\s+months?\b', re.IGNORECASE)
+_RE_PERCENT = re.compile(r'\b\d+%\b')
+_RE_COMPANY = re.compile(r'\bCompany\b')
+_RE_CORPORATION = re.compile(r'\bCorporation\b')
+_RE_INC = re.compile(r'\bInc\b')
+_RE_2023 = re.compile(r'\b2023\b')
+_RE_2024 = re.compile(r'\b2024\b')
+
+
+def _word_pattern(word: str, escape: bool = True) -> re.Pattern:
+    """Case-insensitive whole-word pattern for word (or a prebuilt alternation)."""
+    body = re.escape(word) if escape else '(?:' + word + ')'
+    return re.compile(r'\b' + body + r'\b', re.IGNORECASE)
+
+
+def _metrics_arrays(p0: np.ndarray, P: np.ndarray, orig_case: float, variant_cases: np.ndarray,
+                    orig_conf: float, variant_confs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cosine similarities, risk drifts and confidence stabilities for all variants (NumPy)."""
+    norms = np.linalg.norm(P, axis=1) * np.linalg.norm(p0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sims = np.where(norms > 0, (P @ p0) / norms, 0.0)
+    risk_drifts = np.abs(variant_cases - orig_case) / max(abs(orig_case), 1.0)
+    confidence_stabilities = 1.0 - np.abs(variant_confs - orig_conf)
+    return sims, risk_drifts, confidence_stabilities
+
+
+def _metrics_loops(p0, P, orig_case, variant_cases, orig_conf, variant_confs):
+    """Loop form of _metrics_arrays for Numba, which fuses it into one pass."""
+    n_variants, n_classes = P.shape
+    sims = np.empty(n_variants)
+    risk_drifts = np.empty(n_variants)
+    confidence_stabilities = np.empty(n_variants)
+    
+    norm0 = 0.0
+    for c in range(n_classes):
+        norm0 += p0[c] * p0[c]
+    norm0 = np.sqrt(norm0)
+    scale = max(abs(orig_case), 1.0)
+    
+    for v in range(n_variants):
+        dot = 0.0
+        norm = 0.0
+        for c in range(n_classes):
+            dot += P[v, c] * p0[c]
+            norm += P[v, c] * P[v, c]
+        denom = np.sqrt(norm) * norm0
+        sims[v] = dot / denom if denom > 0 else 0.0
+        risk_drifts[v] = abs(variant_cases[v] - orig_case) / scale
+        confidence_stabilities[v] = 1.0 - abs(variant_confs[v] - orig_conf)
+    return sims, risk_drifts, confidence_stabilities
+
+
+# JIT-compile the metrics kernel when Numba is available; otherwise use the NumPy version
+try:
+    import numba
+    _metrics_kernel = numba.njit(cache=True, fastmath=True)(_metrics_loops)
+except ImportError:
+    _metrics_kernel = _metrics_arrays
+
+
+def _text_key(text: str) -> str:
+    """Stable cache key for a clause text."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ClauseVariant:
     """Represents a generated variant of an original clause."""
     text: str
@@ -33,7 +128,7 @@ class ClauseVariant:
     description: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ClassificationResult:
     """Results from classifying a clause variant."""
     text: str
@@ -45,7 +140,7 @@ class ClassificationResult:
     probability_distribution: np.ndarray
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RobustnessMetrics:
     """Robustness metrics comparing original vs variants."""
     risk_drift_score: float
@@ -61,8 +156,7 @@ class AdversarialTester:
     def __init__(self, seed: int = 42):
         """Initialize the adversarial tester."""
         self.seed = seed
-        random.seed(seed)
-        np.random.seed(seed)
+        self._rng = np.random.default_rng(seed)
         
         # Paraphrase templates
         self.paraphrase_templates = {
@@ -96,20 +190,48 @@ class AdversarialTester:
             'share': 'do not share',
             'store': 'do not store'
         }
+        
+        # Company name swaps
+        self.company_replacements = {
+            'Google': ['Microsoft', 'Apple', 'Amazon', 'Meta'],
+            'Facebook': ['Twitter', 'LinkedIn', 'Instagram', 'TikTok'],
+            'Amazon': ['eBay', 'Walmart', 'Target', 'Best Buy'],
+            'Apple': ['Samsung', 'Google', 'Microsoft', 'Sony'],
+            'Microsoft': ['Google', 'Apple', 'IBM', 'Oracle']
+        }
+        
+        # Option counts per template key, so each generator draws all of its
+        # choices with a single RNG call
+        self._paraphrase_sizes = np.array([len(v) for v in self.paraphrase_templates.values()])
+        self._ambiguity_sizes = np.array([len(v) for v in self.ambiguity_words.values()])
+        self._company_sizes = np.array([len(v) for v in self.company_replacements.values()])
+        
+        # Whole-word patterns compiled once per tester
+        self._negation_patterns = {word: _word_pattern(word) for word in self.negation_words}
+        
+        # One alternation per generator: a failed search skips its replacement
+        # work entirely, and a hit is rewritten in a single sub() pass.
+        # Paraphrase keys match as substrings (as str.replace did); the others as whole words.
+        self._paraphrase_probe = re.compile('|'.join(map(re.escape, self.paraphrase_templates)))
+        self._negation_probe = _word_pattern('|'.join(map(re.escape, self.negation_words)), escape=False)
+        self._ambiguity_probe = _word_pattern('|'.join(map(re.escape, self.ambiguity_words)), escape=False)
 
     def generate_paraphrased_variant(self, clause: str) -> ClauseVariant:
         """Generate a paraphrased variant of the clause."""
         text = clause.lower()
         
-        # Replace key privacy verbs with synonyms
-        for key, synonyms in self.paraphrase_templates.items():
-            if key in text:
-                replacement = random.choice(synonyms)
-                text = text.replace(key, replacement)
+        # Replace key privacy verbs with synonyms (one synonym per verb)
+        if self._paraphrase_probe.search(text):
+            choices = self._rng.integers(0, self._paraphrase_sizes)
+            replacements = {
+                key: synonyms[choice]
+                for (key, synonyms), choice in zip(self.paraphrase_templates.items(), choices)
+            }
+            text = self._paraphrase_probe.sub(lambda m: replacements[m.group()], text)
         
         # Some basic syntactic transformations
-        text = re.sub(r'we (\w+)', r'our company \1s', text)
-        text = re.sub(r'your (\w+)', r'the user\'s \1', text)
+        text = _RE_WE_VERB.sub(r'our company \1s', text)
+        text = _RE_YOUR.sub(r'the user\'s \1', text)
         
         # Capitalize first letter
         text = text.capitalize()
@@ -124,18 +246,19 @@ class AdversarialTester:
         """Generate a negation-flipped variant of the clause."""
         text = clause
         
-        # Add negations to key verbs
-        for positive, negative in self.negation_words.items():
-            pattern = r'\b' + re.escape(positive) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                text = re.sub(pattern, negative, text, flags=re.IGNORECASE)
-                break
+        # Add negations to key verbs (first word in table order that occurs)
+        if self._negation_probe.search(text):
+            for positive, negative in self.negation_words.items():
+                pattern = self._negation_patterns[positive]
+                if pattern.search(text):
+                    text = pattern.sub(negative, text)
+                    break
         
         # Handle some special cases
         if 'will' in text.lower() and 'will not' not in text.lower():
-            text = re.sub(r'\bwill\b', 'will not', text, flags=re.IGNORECASE)
-        elif re.search(r'\bno\s+longer\b', text, re.IGNORECASE):
-            text = re.sub(r'\bno\s+longer\b', '', text, flags=re.IGNORECASE)
+            text = _RE_WILL.sub('will not', text)
+        elif _RE_NO_LONGER.search(text):
+            text = _RE_NO_LONGER.sub('', text)
         
         return ClauseVariant(
             text=text,
@@ -147,19 +270,22 @@ class AdversarialTester:
         """Generate a more ambiguous variant of the clause."""
         text = clause
         
-        # Replace specific terms with vague ones
-        for specific, vague_options in self.ambiguity_words.items():
-            if specific in text.lower():
-                vague = random.choice(vague_options)
-                text = re.sub(r'\b' + re.escape(specific) + r'\b', vague, text, flags=re.IGNORECASE)
+        # Replace specific terms with vague ones (one vague term per word)
+        if self._ambiguity_probe.search(text):
+            choices = self._rng.integers(0, self._ambiguity_sizes)
+            replacements = {
+                specific: vague_options[choice]
+                for (specific, vague_options), choice in zip(self.ambiguity_words.items(), choices)
+            }
+            text = self._ambiguity_probe.sub(lambda m: replacements[m.group().lower()], text)
         
         # Replace specific numbers/durations
-        text = re.sub(r'\b\d+\s+days?\b', 'a reasonable period', text, flags=re.IGNORECASE)
-        text = re.sub(r'\b\d+\s+weeks?\b', 'some time', text, flags=re.IGNORECASE)
-        text = re.sub(r'\b\d+\s+months?\b', 'an extended period', text, flags=re.IGNORECASE)
+        text = _RE_DAYS.sub('a reasonable period', text)
+        text = _RE_WEEKS.sub('some time', text)
+        text = _RE_MONTHS.sub('an extended period', text)
         
         # Replace specific percentages
-        text = re.sub(r'\b\d+%\b', 'a significant percentage', text)
+        text = _RE_PERCENT.sub('a significant percentage', text)
         
         return ClauseVariant(
             text=text,
@@ -172,27 +298,19 @@ class AdversarialTester:
         text = clause
         
         # Company name swaps
-        company_replacements = {
-            'Google': ['Microsoft', 'Apple', 'Amazon', 'Meta'],
-            'Facebook': ['Twitter', 'LinkedIn', 'Instagram', 'TikTok'],
-            'Amazon': ['eBay', 'Walmart', 'Target', 'Best Buy'],
-            'Apple': ['Samsung', 'Google', 'Microsoft', 'Sony'],
-            'Microsoft': ['Google', 'Apple', 'IBM', 'Oracle']
-        }
-        
-        for original, replacements in company_replacements.items():
+        choices = self._rng.integers(0, self._company_sizes)
+        for (original, replacements), choice in zip(self.company_replacements.items(), choices):
             if original in text:
-                replacement = random.choice(replacements)
-                text = text.replace(original, replacement)
+                text = text.replace(original, replacements[choice])
         
         # Generic entity swaps
-        text = re.sub(r'\bCompany\b', 'Organization', text)
-        text = re.sub(r'\bCorporation\b', 'Entity', text)
-        text = re.sub(r'\bInc\b', 'LLC', text)
+        text = _RE_COMPANY.sub('Organization', text)
+        text = _RE_CORPORATION.sub('Entity', text)
+        text = _RE_INC.sub('LLC', text)
         
         # Date swaps (simplified)
-        text = re.sub(r'\b2023\b', '2024', text)
-        text = re.sub(r'\b2024\b', '2025', text)
+        text = _RE_2023.sub('2024', text)
+        text = _RE_2024.sub('2025', text)
         
         # Duration swaps
         duration_swaps = {
@@ -234,38 +352,84 @@ class AdversarialTester:
         
         return variants
 
-    def classify_clause(self, clause: str) -> ClassificationResult:
-        """Classify a single clause using existing PrivyReveal classifier."""
-        try:
-            # Use existing classifier
-            results_df = classify_sentences([clause])
+    def _classify_batch(self, texts: List[str]) -> List[ClassificationResult]:
+        """Classify several clauses with one classifier call and one predict_proba call.
+        
+        Repeated texts (variants often collapse to the original or to each
+        other) are deduplicated up front; texts seen before are served from the
+        classification cache, and only the remaining unique texts hit the model.
+        """
+        # text -> digest for each distinct text, in first-seen order
+        unique_keys = {text: _text_key(text) for text in dict.fromkeys(texts)}
+        
+        entries = {}
+        to_compute = {}
+        with _CACHE_LOCK:
+            for text, key in unique_keys.items():
+                entry = _CLASSIFICATION_CACHE.get(key)
+                if entry is not None:
+                    _CLASSIFICATION_CACHE.move_to_end(key)
+                    entries[key] = entry
+                else:
+                    to_compute[key] = text
+        
+        if to_compute:
+            new_texts = list(to_compute.values())
             
-            if results_df.empty:
-                raise ValueError("Classification returned empty results")
+            # Get probability distributions from explainer pipeline in the same batch
+            explainer = get_explainer_pipeline()
+            # Kept as float32: half the memory per cached row and per similarity matmul
+            prob_dists = np.asarray(explainer.predict_proba(new_texts), dtype=np.float32)
             
-            result = results_df.iloc[0]
+            results_df = classify_sentences(new_texts)
+            if len(results_df) != len(new_texts):
+                raise ValueError(f"Classification returned {len(results_df)} results for {len(new_texts)} texts")
+            rows = [row for _, row in results_df.iterrows()]
             
-            # Get probability distribution from explainer pipeline
-            explainer = get_explainer_pipeline()
-            prob_dist = explainer.predict_proba([clause])[0]
+            for key, row, prob_dist in zip(to_compute, rows, prob_dists):
+                # Cached rows are shared by every later result for the same text
+                prob_dist.flags.writeable = False
+                entries[key] = (row['top1_label'], row['rating'], row['case_score'],
+                                row['confidence'], row['top3'], prob_dist)
             
-            return ClassificationResult(
-                text=clause,
-                top1_label=result['top1_label'],
-                rating=result['rating'],
-                case_score=result['case_score'],
-                confidence=result['confidence'],
-                top3=result['top3'],
+            with _CACHE_LOCK:
+                if _CACHE_LIMIT:
+                    for key in to_compute:
+                        _CLASSIFICATION_CACHE[key] = entries[key]
+                while len(_CLASSIFICATION_CACHE) > _CACHE_LIMIT:
+                    _CLASSIFICATION_CACHE.popitem(last=False)
+        
+        # Scatter the per-unique-text entries back to every input position
+        results = []
+        for text in texts:
+            top1_label, rating, case_score, confidence, top3, prob_dist = entries[unique_keys[text]]
+            results.append(ClassificationResult(
+                text=text,
+                top1_label=top1_label,
+                rating=rating,
+                case_score=case_score,
+                confidence=confidence,
+                top3=top3,
                 probability_distribution=prob_dist
-            )
-            
+            ))
+        return results
+
+    def classify_clause(self, clause: str) -> ClassificationResult:
+        """Classify a single clause using existing PrivyReveal classifier."""
+        try:
+            return self._classify_batch([clause])[0]
         except Exception as e:
             logger.error(f"Classification failed for clause '{clause}': {e}")
             raise
 
     def calculate_robustness_metrics(self, original: ClassificationResult, 
-                                     variants: List[ClassificationResult]) -> RobustnessMetrics:
-        """Calculate robustness metrics comparing original vs variants."""
+                                     variants: List[ClassificationResult],
+                                     variant_types: Optional[List[str]] = None) -> RobustnessMetrics:
+        """Calculate robustness metrics comparing original vs variants.
+        
+        variant_types runs parallel to variants (the ClauseVariant.variant_type
+        each was generated with); variants without one are reported as 'unknown'.
+        """
         if not variants:
             return RobustnessMetrics(
                 risk_drift_score=0.0,
@@ -275,45 +439,50 @@ class AdversarialTester:
                 variant_results=[]
             )
         
-        variant_results = []
-        risk_drifts = []
-        label_stabilities = []
-        confidence_stabilities = []
-        probability_similarities = []
+        # Variants identical to the original (no replacement fired) have identity
+        # metrics; only the changed ones go through the kernel
+        n_variants = len(variants)
+        probability_similarities = np.ones(n_variants)
+        risk_drifts = np.zeros(n_variants)
+        confidence_stabilities = np.ones(n_variants)
+        changed = [k for k, v in enumerate(variants) if v.text != original.text]
+        if changed:
+            # Per-variant scalars and cosine similarities in one kernel call
+            changed_variants = [variants[k] for k in changed]
+            case_scores = np.array([v.case_score for v in changed_variants], dtype=np.float64)
+            confidences = np.array([v.confidence for v in changed_variants], dtype=np.float64)
+            P = np.ascontiguousarray(np.stack([v.probability_distribution for v in changed_variants]), dtype=np.float32)
+            p0 = np.ascontiguousarray(original.probability_distribution, dtype=np.float32)
+            sims, drifts, conf_stabs = _metrics_kernel(
+                p0, P, float(original.case_score), case_scores, float(original.confidence), confidences
+            )
+            probability_similarities[changed] = sims
+            risk_drifts[changed] = drifts
+            confidence_stabilities[changed] = conf_stabs
         
+        original_label_idx = _LABEL2IDX.get(original.top1_label)
+        label_stabilities = []
         for variant in variants:
-            # Risk drift: normalized difference in case scores
-            risk_drift = abs(variant.case_score - original.case_score) / max(abs(original.case_score), 1.0)
-            risk_drifts.append(risk_drift)
-            
-            # Label stability: 1.0 if same label, decreases with probability shift
-            if variant.top1_label == original.top1_label:
+            # Label stability: 1.0 if same label (or unchanged text), decreases with probability shift
+            if variant.top1_label == original.top1_label or variant.text == original.text:
                 label_stability = 1.0
             else:
-                # Get index of original label in variant distribution
-                try:
-                    original_label_idx = list(id2label.values()).index(original.top1_label)
-                    original_prob_in_variant = variant.probability_distribution[original_label_idx]
-                    label_stability = original_prob_in_variant
-                except (ValueError, IndexError):
+                # Original label's probability in the variant distribution
+                dist = variant.probability_distribution
+                if original_label_idx is not None and original_label_idx < len(dist):
+                    label_stability = float(dist[original_label_idx])
+                else:
                     label_stability = 0.0
             label_stabilities.append(label_stability)
-            
-            # Confidence stability: normalized difference in confidence
-            confidence_stability = 1.0 - abs(variant.confidence - original.confidence)
-            confidence_stabilities.append(confidence_stability)
-            
-            # Probability similarity: cosine similarity between distributions
-            prob_sim = self._cosine_similarity(original.probability_distribution, 
-                                              variant.probability_distribution)
-            probability_similarities.append(prob_sim)
-            
-            variant_results.append({
+        
+        if variant_types is None:
+            variant_types = []
+        variant_types = list(variant_types) + ['unknown'] * (len(variants) - len(variant_types))
+        
+        variant_results = [
+            {
                 'text': variant.text,
-                'variant_type': 'paraphrased' if 'paraphrased' in variant.text.lower() else 
-                              'negation_flipped' if 'not' in variant.text.lower() else
-                              'ambiguous' if any(word in variant.text.lower() for word in ['certain', 'approximately']) else
-                              'entity_swapped',
+                'variant_type': variant_type,
                 'top1_label': variant.top1_label,
                 'rating': variant.rating,
                 'case_score': variant.case_score,
@@ -322,13 +491,18 @@ class AdversarialTester:
                 'label_stability': label_stability,
                 'confidence_stability': confidence_stability,
                 'probability_similarity': prob_sim
-            })
+            }
+            for variant, variant_type, risk_drift, label_stability, confidence_stability, prob_sim in zip(
+                variants, variant_types, risk_drifts.tolist(), label_stabilities,
+                confidence_stabilities.tolist(), probability_similarities.tolist()
+            )
+        ]
         
         # Aggregate metrics
-        avg_risk_drift = np.mean(risk_drifts) if risk_drifts else 0.0
-        avg_label_stability = np.mean(label_stabilities) if label_stabilities else 0.0
-        avg_confidence_stability = np.mean(confidence_stabilities) if confidence_stabilities else 0.0
-        avg_probability_similarity = np.mean(probability_similarities) if probability_similarities else 0.0
+        avg_risk_drift = float(risk_drifts.mean())
+        avg_label_stability = float(sum(label_stabilities) / len(label_stabilities))
+        avg_confidence_stability = float(confidence_stabilities.mean())
+        avg_probability_similarity = float(probability_similarities.mean())
         
         # Normalize final scores (0-1 range)
         risk_drift_score = min(1.0, avg_risk_drift)
@@ -342,39 +516,30 @@ class AdversarialTester:
             variant_results=variant_results
         )
 
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
-
     def test_clause_robustness(self, clause: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Test robustness of a single clause against adversarial variants."""
         logger.info(f"Testing robustness for clause: {clause[:50]}...")
         
-        # Classify original clause
-        original_result = self.classify_clause(clause)
-        
-        # Generate variants
+        # Generate variants, then classify original + variants in one batch
         variants = self.generate_variants(clause)
+        all_texts = [clause] + [v.text for v in variants]
+        try:
+            classified = self._classify_batch(all_texts)
+        except Exception as e:
+            logger.error(f"Classification failed for clause '{clause}': {e}")
+            raise
         
-        # Classify each variant
-        variant_results = []
-        for variant in variants:
-            try:
-                variant_result = self.classify_clause(variant.text)
-                variant_results.append(variant_result)
-            except Exception as e:
-                logger.warning(f"Failed to classify variant: {e}")
-                continue
-        
+        return self._build_robustness_report(
+            classified[0], classified[1:], metadata, [v.variant_type for v in variants]
+        )
+
+    def _build_robustness_report(self, original_result: ClassificationResult,
+                                 variant_results: List[ClassificationResult],
+                                 metadata: Optional[Dict[str, Any]] = None,
+                                 variant_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Assemble the per-clause robustness report from classified results."""
         # Calculate robustness metrics
-        robustness_metrics = self.calculate_robustness_metrics(original_result, variant_results)
+        robustness_metrics = self.calculate_robustness_metrics(original_result, variant_results, variant_types)
         
         return {
             'original': {
@@ -395,23 +560,31 @@ class AdversarialTester:
             'metadata': metadata or {}
         }
 
+# Clauses classified per batch (and per pool task); bounds how many variant
+# texts and unyielded results are held at once
+_SUITE_WINDOW = 32
 
-def run_robustness_suite(clauses: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """
-    Run comprehensive robustness testing on a list of clauses.
-    
-    Args:
-        clauses: List of dictionaries with 'text' and optional 'metadata'
+
+def _suite_windows(indexed_clauses: List[Tuple[int, Dict[str, Any]]]) -> List[List[Tuple[int, Dict[str, Any]]]]:
+    """Split (index, clause) pairs into consecutive windows of _SUITE_WINDOW."""
+    return [indexed_clauses[k:k + _SUITE_WINDOW] for k in range(0, len(indexed_clauses), _SUITE_WINDOW)]
+
+
+def _run_suite_window(tester: AdversarialTester,
+                      indexed_clauses: List[Tuple[int, Dict[str, Any]]],
+                      seed: int) -> Iterator[Dict[str, Any]]:
+    """Test one window of (index, clause) pairs with a single classifier batch.
     
-    Returns:
-        JSON-serializable summary of robustness testing results
+    Variant generation is reseeded from seed and the window's first clause
+    index, so results don't depend on which process runs the window.
     """
-    logger.info(f"Running robustness suite on {len(clauses)} clauses")
-    
-    tester = AdversarialTester()
-    results = []
+    tester._rng = np.random.default_rng((seed, indexed_clauses[0][0]))
     
-    for i, clause_data in enumerate(clauses):
+    # Generate variants for every clause in the window so all texts go through
+    # the classifier as a single batch; spans map each clause to its slice
+    pending = []
+    all_texts = []
+    for i, clause_data in indexed_clauses:
         clause_text = clause_data.get('text', '')
         metadata = clause_data.get('metadata', {})
         
@@ -419,26 +592,123 @@ def run_robustness_suite(clauses: List[Dict[str, Any]]) -> Dict[str, Any]:
             logger.warning(f"Empty clause at index {i}, skipping")
             continue
         
+        variants = tester.generate_variants(clause_text)
+        start = len(all_texts)
+        all_texts.append(clause_text)
+        all_texts.extend(v.text for v in variants)
+        pending.append((i, clause_text, metadata, start, len(all_texts),
+                        [v.variant_type for v in variants]))
+    
+    try:
+        classified = tester._classify_batch(all_texts) if all_texts else []
+    except Exception as e:
+        # Fall back to per-clause batches so one bad clause doesn't fail the suite
+        logger.warning(f"Batch classification failed, retrying per clause: {e}")
+        classified = None
+    
+    for i, clause_text, metadata, start, end, variant_types in pending:
         try:
-            result = tester.test_clause_robustness(clause_text, metadata)
-            results.append(result)
+            if classified is None:
+                result = tester.test_clause_robustness(clause_text, metadata)
+            else:
+                result = tester._build_robustness_report(
+                    classified[start], classified[start + 1:end], metadata, variant_types
+                )
         except Exception as e:
             logger.error(f"Failed to test clause {i}: {e}")
-            results.append({
+            result = {
                 'original': {'text': clause_text, 'error': str(e)},
                 'robustness_metrics': {},
                 'variants': [],
                 'metadata': metadata
-            })
+            }
+        yield result
+
+
+# Per-process tester for the worker pool, so the classifier loads once per worker
+_WORKER_TESTER: Optional[AdversarialTester] = None
+
+
+def _init_suite_worker(seed: int) -> None:
+    """Process pool initializer: build this worker's tester."""
+    global _WORKER_TESTER
+    _WORKER_TESTER = AdversarialTester(seed=seed)
+
+
+def _suite_worker(indexed_clauses: List[Tuple[int, Dict[str, Any]]], seed: int) -> List[Dict[str, Any]]:
+    """Process pool task: test one window of clauses with this worker's tester."""
+    return list(_run_suite_window(_WORKER_TESTER, indexed_clauses, seed))
+
+
+def iter_robustness_suite(clauses: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                          seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the robustness result for each non-empty clause, in input order.
     
-    # Calculate aggregate statistics
-    if results:
-        risk_drifts = [r['robustness_metrics'].get('risk_drift_score', 0) for r in results if 'robustness_metrics' in r]
-        label_stabilities = [r['robustness_metrics'].get('label_stability_score', 0) for r in results if 'robustness_metrics' in r]
-        
-        avg_risk_drift = np.mean(risk_drifts) if risk_drifts else 0.0
-        avg_label_stability = np.mean(label_stabilities) if label_stabilities else 0.0
-        
+    Args:
+        clauses: List of dictionaries with 'text' and optional 'metadata'
+        max_workers: Worker processes to spread clauses over; each loads its own
+            classifier. None or 1 runs in-process.
+        seed: Random seed for variant generation, combined with each window's
+            start index so pooled and in-process runs agree
+    """
+    windows = _suite_windows(list(enumerate(clauses)))
+    if max_workers and max_workers > 1 and len(windows) > 1:
+        n_workers = min(max_workers, len(windows))
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_suite_worker,
+                                 initargs=(seed,)) as executor:
+            # Keep at most two windows per worker in flight, yielding each in
+            # input order as soon as it is done
+            in_flight = deque()
+            for window in windows:
+                in_flight.append(executor.submit(_suite_worker, window, seed))
+                if len(in_flight) >= 2 * n_workers:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+    else:
+        tester = AdversarialTester(seed=seed)
+        for window in windows:
+            yield from _run_suite_window(tester, window, seed)
+
+
+def run_robustness_suite(clauses: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                         seed: int = 42, collect_detailed: bool = True) -> Dict[str, Any]:
+    """
+    Run comprehensive robustness testing on a list of clauses.
+    
+    Args:
+        clauses: List of dictionaries with 'text' and optional 'metadata'
+        max_workers: Worker processes to spread clauses over; each loads its own
+            classifier. None or 1 runs in-process.
+        seed: Random seed for variant generation, combined with each window's
+            start index so pooled and in-process runs agree
+        collect_detailed: Keep per-clause results; False returns only the summary
+    
+    Returns:
+        JSON-serializable summary of robustness testing results
+    """
+    logger.info(f"Running robustness suite on {len(clauses)} clauses")
+    
+    # Aggregate statistics as results stream in, keeping only running sums
+    results = []
+    risk_sum = 0.0
+    label_sum = 0.0
+    n = 0
+    successful = 0
+    for r in iter_robustness_suite(clauses, max_workers=max_workers, seed=seed):
+        if 'robustness_metrics' in r:
+            risk_sum += r['robustness_metrics'].get('risk_drift_score', 0)
+            label_sum += r['robustness_metrics'].get('label_stability_score', 0)
+            n += 1
+        if 'error' not in r.get('original', {}):
+            successful += 1
+        if collect_detailed:
+            results.append(r)
+    
+    if n:
+        avg_risk_drift = risk_sum / n
+        avg_label_stability = label_sum / n
         overall_robustness = 1.0 - avg_risk_drift
     else:
         avg_risk_drift = 0.0
@@ -448,7 +718,7 @@ def run_robustness_suite(clauses: List[Dict[str, Any]]) -> Dict[str, Any]:
     return {
         'summary': {
             'total_clauses': len(clauses),
-            'successful_tests': len([r for r in results if 'error' not in r.get('original', {})]),
+            'successful_tests': successful,
             'average_risk_drift': avg_risk_drift,
             'average_label_stability': avg_label_stability,
             'overall_robustness_score': overall_robustness
@@ -457,7 +727,6 @@ def run_robustness_suite(clauses: List[Dict[str, Any]]) -> Dict[str, Any]:
         'timestamp': np.datetime64('now').astype(str)
     }
 
-
 if __name__ == "__main__":
     # Example usage
     test_clauses = [
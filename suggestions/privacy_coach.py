@@ -1,18 +1,121 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Set
+from itertools import islice
+from collections import OrderedDict
+import hashlib
 import re
-import urllib.parse
+import sys
+import threading
 
-def _domain_from_text(text: str) -> Optional[str]:
-    urls = re.findall(r'(https?://[^\s)"<>]+|www\.[^\s)"<>]+)', text)
-    emails = re.findall(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', text)
+# Contact patterns run over the whole policy text; use RE2 (linear-time, no
+# backtracking) for them when google-re2 is installed
+try:
+    import re2 as _contact_re
+except ImportError:
+    _contact_re = re
+
+# RE2's \s is ASCII-only while re's is Unicode-aware, so patterns compiled with
+# _contact_re spell out every Unicode whitespace character (the str.isspace set)
+_UNICODE_WS = ''.join(c for c in map(chr, range(0x3001)) if c.isspace())
+
+# Commas/semicolons end a URL; trailing sentence punctuation is stripped after matching
+_RE_URLS = _contact_re.compile('(?:https?://|www\\.)[^' + _UNICODE_WS + ')"<>,;]+')
+_URL_TRAILING = '.,;:'
+_RE_EMAILS = _contact_re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+# \d is likewise ASCII-only in RE2; phones keep stdlib re so Unicode digits still match
+_RE_PHONES = re.compile(r'\+?\d[\d\-\s\(\)]{7,}')
+
+# Action-link words, found (overlaps included) in one scan of each URL
+_RE_ACTION_WORDS = re.compile(r'(?=(cookie|consent|preferences|privacy|request|rights|sharing|sell|delete|erasure|settings))', re.IGNORECASE)
+# Link kind -> word sets that must each contribute at least one word found in the URL
+_ACTION_LINK_RULES: Dict[str, tuple] = {
+    'cookies': (frozenset({'cookie','consent','preferences'}),),
+    'sharing': (frozenset({'privacy','request','rights'}), frozenset({'sharing','sell'})),
+    'deletion': (frozenset({'privacy','request','delete','erasure'}),),
+    'settings': (frozenset({'settings','preferences'}),),
+}
+
+# Keyword groups for _detect_categories; a clause matches a group if any keyword occurs in it
+_WEAK_CONTROL_EXEMPT = '_weak_control_exempt'
+_KEYWORD_GROUPS: Dict[str, tuple] = {
+    'tracking': ('cookie','track','fingerprint','device id','telemetry'),
+    'third_party_sharing': ('third','partners','affiliates','vendors','advertisers','analytics'),
+    'sensitive_collection': ('biometric','health','medical','financial','ssn','passport','precise location'),
+    'long_term_retention': ('retain','store','archive','indefinite','permanent','years'),
+    'profiling': ('profile','personalize','targeted advertising','segmentation','inference'),
+    'cross_device': ('cross-device','merge data','combine data','device graph'),
+    'ad_tech': ('google analytics','meta pixel','adtech','advertising partners','programmatic'),
+    'weak_controls': ('may', 'might', 'we may', 'from time to time'),
+    # Opt-out language cancels a weak_controls match
+    _WEAK_CONTROL_EXEMPT: ('opt-out','opt out','unsubscribe','settings'),
+    'invasive_permissions': ('camera','microphone','contacts','location permission'),
+    'unclear_wording': ('as permitted by law','legitimate interests','necessary for','other purposes'),
+}
+# Classifier labels that place a clause in a category regardless of keywords
+_LABEL_CATEGORIES = {
+    'tracking': 'tracking',
+    'data_sharing': 'third_party_sharing',
+    'data_retention': 'long_term_retention',
+}
+
+# Case-insensitive alternation per group: one C-level search instead of a
+# lowercased copy plus a substring test per keyword. The keywords are ASCII and
+# only ASCII letters are case-folded, the same as Hyperscan's HS_FLAG_CASELESS
+_KEYWORD_GROUP_RES = {
+    g: re.compile('|'.join(map(re.escape, words)), re.IGNORECASE | re.ASCII)
+    for g, words in _KEYWORD_GROUPS.items()
+}
+
+# keyword -> groups it belongs to (a keyword may feed several groups)
+_KEYWORD_OWNERS: Dict[str, tuple] = {}
+for _group, _words in _KEYWORD_GROUPS.items():
+    for _word in _words:
+        _KEYWORD_OWNERS[_word] = _KEYWORD_OWNERS.get(_word, ()) + (_group,)
+del _group, _words, _word
+
+# Optional Hyperscan DFA database: finds every keyword in a single pass, with
+# the same ASCII case-folding as _KEYWORD_GROUP_RES
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[re.escape(w).encode('utf-8') for w in _KEYWORD_OWNERS],
+            ids=list(range(len(_KEYWORD_OWNERS))),
+            elements=len(_KEYWORD_OWNERS),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_KEYWORD_OWNERS)
+        )
+    except hyperscan.error:
+        # Fall back to the regex matchers rather than fail at import
+        _HS_DB = None
+    else:
+        _HS_KEYWORD_GROUPS = list(_KEYWORD_OWNERS.values())
+        # A database shares one scratch space, so scans are serialized
+        _HS_LOCK = threading.Lock()
+        
+        def _hs_on_match(pattern_id, start, end, flags, context):
+            context.append(pattern_id)
+
+def _domain_from_contacts(urls: List[str], emails: List[str]) -> Optional[str]:
     if urls:
+        # URLs matched by _RE_URLS start with http(s):// or www., so the netloc is
+        # everything up to the first path/query/fragment delimiter
         u0 = urls[0]
-        if not u0.startswith('http'):
-            u0 = 'http://' + u0
-        try:
-            return urllib.parse.urlparse(u0).netloc
-        except Exception:
+        rest = u0.split('://', 1)[1] if u0.startswith('http') else u0
+        end = len(rest)
+        for delim in '/?#':
+            i = rest.find(delim, 0, end)
+            if i != -1:
+                end = i
+        netloc = rest[:end]
+        if ('[' in netloc) != (']' in netloc):
+            # Unbalanced IPv6 brackets: urlparse rejected these too
             return None
+        return netloc
     if emails:
         try:
             return emails[0].split('@')[1]
@@ -20,6 +123,15 @@ def _domain_from_text(text: str) -> Optional[str]:
             return None
     return None
 
+def _keyword_groups(text: str) -> Set[str]:
+    """Keyword groups with at least one keyword occurring in text (ASCII case-insensitive)"""
+    if _HS_DB is not None:
+        hit_ids: List[int] = []
+        with _HS_LOCK:
+            _HS_DB.scan(text.encode('utf-8', 'surrogatepass'), match_event_handler=_hs_on_match, context=hit_ids)
+        return {g for i in hit_ids for g in _HS_KEYWORD_GROUPS[i]}
+    return {g for g, pattern in _KEYWORD_GROUP_RES.items() if pattern.search(text)}
+
 def _detect_categories(clauses: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     cats: Dict[str, List[Dict[str, Any]]] = {
         'tracking': [],
@@ -33,75 +145,127 @@ def _detect_categories(clauses: List[Dict[str, Any]]) -> Dict[str, List[Dict[str
         'invasive_permissions': [],
         'unclear_wording': []
     }
+    # Hot loop: bind lookups locally and only visit the categories that matched
+    keyword_groups = _keyword_groups
+    label_category = _LABEL_CATEGORIES.get
+    bucket_for = cats.get
     for c in clauses:
-        t = c.get('text', '').lower()
-        if c.get('label') == 'tracking' or any(w in t for w in ['cookie','track','fingerprint','device id','telemetry']):
-            cats['tracking'].append(c)
-        if c.get('label') == 'data_sharing' or any(w in t for w in ['third','partners','affiliates','vendors','advertisers','analytics']):
-            cats['third_party_sharing'].append(c)
-        if any(w in t for w in ['biometric','health','medical','financial','ssn','passport','precise location']):
-            cats['sensitive_collection'].append(c)
-        if c.get('label') == 'data_retention' or any(w in t for w in ['retain','store','archive','indefinite','permanent','years']):
-            cats['long_term_retention'].append(c)
-        if any(w in t for w in ['profile','personalize','targeted advertising','segmentation','inference']):
-            cats['profiling'].append(c)
-        if any(w in t for w in ['cross-device','merge data','combine data','device graph']):
-            cats['cross_device'].append(c)
-        if any(w in t for w in ['google analytics','meta pixel','adtech','advertising partners','programmatic']):
-            cats['ad_tech'].append(c)
-        if any(w in t for w in ['may', 'might', 'we may', 'from time to time']) and not any(w in t for w in ['opt-out','opt out','unsubscribe','settings']):
-            cats['weak_controls'].append(c)
-        if any(w in t for w in ['camera','microphone','contacts','location permission']):
-            cats['invasive_permissions'].append(c)
-        if any(w in t for w in ['as permitted by law','legitimate interests','necessary for','other purposes']):
-            cats['unclear_wording'].append(c)
+        matched = keyword_groups(c.get('text', ''))
+        label_cat = label_category(c.get('label'))
+        if label_cat is not None:
+            matched.add(label_cat)
+        if _WEAK_CONTROL_EXEMPT in matched:
+            matched.discard('weak_controls')
+        for cat in matched:
+            bucket = bucket_for(cat)
+            if bucket is not None:
+                bucket.append(c)
     return cats
 
 def _extract_links_and_contacts(text: str) -> Dict[str, List[str]]:
-    urls = re.findall(r'(https?://[^\s)"<>]+|www\.[^\s)"<>]+)', text)
-    emails = re.findall(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', text)
-    phones = re.findall(r'\+?\d[\d\-\s\(\)]{7,}', text)
+    urls = [u.rstrip(_URL_TRAILING) for u in _RE_URLS.findall(text)]
+    emails = _RE_EMAILS.findall(text)
+    phones = _RE_PHONES.findall(text)
     return { 'urls': urls, 'emails': emails, 'phones': phones }
 
+def _action_links(urls: List[str]) -> Dict[str, Optional[str]]:
+    """First URL per action-link kind (None when no URL qualifies)"""
+    links: Dict[str, Optional[str]] = dict.fromkeys(_ACTION_LINK_RULES)
+    remaining = dict(_ACTION_LINK_RULES)
+    for u in urls:
+        # Case-insensitive scan of the URL itself; only the short matched words are lowercased
+        words = {m.group(1).lower() for m in _RE_ACTION_WORDS.finditer(u)}
+        if not words:
+            continue
+        for kind, required in list(remaining.items()):
+            if all(words & req for req in required):
+                links[kind] = u
+                del remaining[kind]
+        if not remaining:
+            # Every kind has its link; later URLs can't change the result
+            break
+    return links
+
+# Suggestion templates in output order:
+# (category, max clauses, action text, key into _action_links output or None)
+_COACH_ACTIONS = (
+    ('tracking', 3, "set cookies to 'Essential only' and turn off tracking", 'cookies'),
+    ('third_party_sharing', 3, "disable partner sharing and advertising personalization in account privacy settings", 'sharing'),
+    ('long_term_retention', 3, "submit a deletion request and periodically remove stored data", 'deletion'),
+    ('sensitive_collection', 2, "avoid providing sensitive data and request removal of any uploads", None),
+    ('profiling', 2, "turn off ad personalization and profiling in settings", None),
+    ('cross_device', 2, "sign out on unused devices and avoid cross-account linking", None),
+    ('ad_tech', 2, "opt out of advertising integrations and clear tracking history", None),
+    ('weak_controls', 2, "use account privacy settings to explicitly opt out of optional processing", 'settings'),
+    ('invasive_permissions', 2, "revoke app permissions like camera, microphone, contacts, and precise location", None),
+    ('unclear_wording', 2, "ask the privacy team to clarify vague purposes and obtain explicit consent", 'email'),
+)
+
+_MAX_SUGGESTIONS = 12
+
+def _iter_suggestions(site: Optional[str], cats: Dict[str, List[Dict[str, Any]]],
+                      links: Dict[str, Optional[str]]) -> Iterator[Dict[str, str]]:
+    for category, limit, action_text, link_kind in _COACH_ACTIONS:
+        link = links[link_kind] if link_kind else None
+        for cl in cats[category][:limit]:
+            yield _make_suggestion(site, cl, action_text, link)
+
 def _make_suggestion(site: Optional[str], clause: Dict[str, Any], action_text: str, link: Optional[str]) -> Dict[str, str]:
     name = site or 'this site'
     snippet = clause.get('text','')[:220]
+    # Labels parsed from JSON are fresh strings per clause; intern them so all
+    # suggestions of a category share one object
+    category = clause.get('label','general')
+    if isinstance(category, str):
+        category = sys.intern(category)
     if link:
-        return { 'category': clause.get('label','general'), 'text': f"On {name}, {action_text} ({link})", 'evidence': snippet }
-    return { 'category': clause.get('label','general'), 'text': f"On {name}, {action_text}", 'evidence': snippet }
+        return { 'category': category, 'text': f"On {name}, {action_text} ({link})", 'evidence': snippet }
+    return { 'category': category, 'text': f"On {name}, {action_text}", 'evidence': snippet }
+
+# Recent coach outputs keyed by a digest of everything they depend on, so UI
+# re-renders of the same analysis skip the regex and keyword passes
+_COACH_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_COACH_CACHE_SIZE = 128
+_COACH_LOCK = threading.Lock()
+
+def _coach_cache_key(clauses: List[Dict[str, Any]], full_text: str, site_hint: Optional[str]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(site_hint).encode('utf-8'))
+    h.update(b'\x1e')
+    h.update(full_text.encode('utf-8', 'surrogatepass'))
+    for c in clauses:
+        h.update(b'\x1e')
+        h.update(repr(c.get('label', 'general')).encode('utf-8'))
+        h.update(b'\x1f')
+        h.update(c.get('text', '').encode('utf-8', 'surrogatepass'))
+    return h.hexdigest()
 
 def generate_privacy_coach(analysis: Dict[str, Any], site_hint: Optional[str], green: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     clauses = analysis.get('clauses', []) if analysis else []
-    full_text = analysis.get('full_text', '') if analysis else ''
-    site = site_hint or _domain_from_text(full_text or " ".join([c.get('text','') for c in clauses]))
+    full_text = (analysis.get('full_text') if analysis else None) or ''
+    key = _coach_cache_key(clauses, full_text, site_hint)
+    with _COACH_LOCK:
+        cached = _COACH_CACHE.get(key)
+        if cached is not None:
+            _COACH_CACHE.move_to_end(key)
+    if cached is None:
+        cached = _build_privacy_coach(clauses, full_text, site_hint)
+        with _COACH_LOCK:
+            _COACH_CACHE[key] = cached
+            if len(_COACH_CACHE) > _COACH_CACHE_SIZE:
+                _COACH_CACHE.popitem(last=False)
+    # Fresh containers per call so callers can't mutate the cached result
+    return {**cached, 'top_risks': list(cached['top_risks']), 'suggestions': [dict(x) for x in cached['suggestions']]}
+
+def _build_privacy_coach(clauses: List[Dict[str, Any]], full_text: str, site_hint: Optional[str]) -> Dict[str, Any]:
+    effective_text = full_text or " ".join(c.get('text','') for c in clauses)
+    contacts = _extract_links_and_contacts(effective_text)
+    site = site_hint or _domain_from_contacts(contacts['urls'], contacts['emails'])
     cats = _detect_categories(clauses)
-    contacts = _extract_links_and_contacts(full_text or " ".join([c.get('text','') for c in clauses]))
-    suggestions: List[Dict[str, str]] = []
+    links = _action_links(contacts['urls'])
+    links['email'] = next(iter(contacts['emails']), None)
     top_risks = [k for k, v in cats.items() if len(v) > 0]
-    for cl in cats['tracking'][:3]:
-        link = next((u for u in contacts['urls'] if any(x in u.lower() for x in ['cookie','consent','preferences'])), None)
-        suggestions.append(_make_suggestion(site, cl, "set cookies to 'Essential only' and turn off tracking", link))
-    for cl in cats['third_party_sharing'][:3]:
-        link = next((u for u in contacts['urls'] if any(x in u.lower() for x in ['privacy','request','rights']) and any(y in u.lower() for y in ['sharing','sell'])), None)
-        suggestions.append(_make_suggestion(site, cl, "disable partner sharing and advertising personalization in account privacy settings", link))
-    for cl in cats['long_term_retention'][:3]:
-        link = next((u for u in contacts['urls'] if any(x in u.lower() for x in ['privacy','request','delete','erasure'])), None)
-        suggestions.append(_make_suggestion(site, cl, "submit a deletion request and periodically remove stored data", link))
-    for cl in cats['sensitive_collection'][:2]:
-        suggestions.append(_make_suggestion(site, cl, "avoid providing sensitive data and request removal of any uploads", None))
-    for cl in cats['profiling'][:2]:
-        suggestions.append(_make_suggestion(site, cl, "turn off ad personalization and profiling in settings", None))
-    for cl in cats['cross_device'][:2]:
-        suggestions.append(_make_suggestion(site, cl, "sign out on unused devices and avoid cross-account linking", None))
-    for cl in cats['ad_tech'][:2]:
-        suggestions.append(_make_suggestion(site, cl, "opt out of advertising integrations and clear tracking history", None))
-    for cl in cats['weak_controls'][:2]:
-        link = next((u for u in contacts['urls'] if 'settings' in u.lower() or 'preferences' in u.lower()), None)
-        suggestions.append(_make_suggestion(site, cl, "use account privacy settings to explicitly opt out of optional processing", link))
-    for cl in cats['invasive_permissions'][:2]:
-        suggestions.append(_make_suggestion(site, cl, "revoke app permissions like camera, microphone, contacts, and precise location", None))
-    for cl in cats['unclear_wording'][:2]:
-        email = next(iter(contacts['emails']), None)
-        suggestions.append(_make_suggestion(site, cl, "ask the privacy team to clarify vague purposes and obtain explicit consent", email))
+    # Build only as many suggestions as are returned
+    suggestions = list(islice(_iter_suggestions(site, cats, links), _MAX_SUGGESTIONS))
     overall_summary = (f"Top risks on {site or 'this site'}: " + ", ".join(top_risks)) if top_risks else "Risks not detected"
-    return { 'site': site, 'overall_summary': overall_summary, 'top_risks': top_risks, 'suggestions': suggestions[:12] }
\ No newline at end of file
+    return { 'site': site, 'overall_summary': overall_summary, 'top_risks': top_risks, 'suggestions': suggestions }
\ No newline at end of file
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+import base
+from base import CacheManager
+
+
+def test_cache_entry_expires_at_ttl_even_when_hit_often(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(base.time, "time", lambda: now[0])
+    cache = CacheManager(ttl=3600, min_ttl=60)
+    cache.set("k", "v")
+    
+    while now[0] + 30 < 3600:
+        now[0] += 30
+        assert cache.get("k") == "v"
+    
+    now[0] = 3600
+    assert cache.get("k") is None
+
+
+
+def test_never_hit_entry_expires_after_min_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(base.time, "time", lambda: now[0])
+    cache = CacheManager(ttl=3600, min_ttl=60)
+    cache.set("fresh", "v")
+    cache.set("idle", "v")
+    
+    now[0] = 59
+    assert cache.get("fresh") == "v"
+    now[0] = 61
+    assert cache.get("idle") is None
+
+
+def test_hit_entry_earns_longer_idle_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(base.time, "time", lambda: now[0])
+    cache = CacheManager(ttl=3600, min_ttl=60)
+    cache.set("k", "v")
+    
+    now[0] = 50
+    assert cache.get("k") == "v"
+    # Active for 50s, so it may now sit idle for 100s rather than min_ttl
+    now[0] = 140
+    assert cache.get("k") == "v"
+    # Active for 140s: idle allowance 280s
+    now[0] = 140 + 281
+    assert cache.get("k") is None
+
+
+def test_default_min_ttl_keeps_full_idle_lifetime(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(base.time, "time", lambda: now[0])
+    cache = CacheManager(ttl=3600)
+    cache.set("k", "v")
+    
+    now[0] = 3599
+    assert cache.get("k") == "v"
+
+def test_concurrent_first_records_keep_all_history():
+    import threading
+    
+    for _ in range(50):
+        collector = base.MetricsCollector()
+        barrier = threading.Barrier(8)
+        
+        def record():
+            barrier.wait()
+            collector.record_metric("new_metric", 1.0)
+        
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len(collector.metrics["new_metric"]) == 8
+        assert collector.get_metric_stats("new_metric")["count"] == 8
+
+
+def test_cache_key_folds_non_ascii_case():
+    assert base.create_cache_key("  ÉCOLE Policy ", "t") == base.create_cache_key("école policy", "t")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_serializes_numpy_values_with_and_without_orjson(monkeypatch, use_orjson):
+    np = pytest.importorskip("numpy")
+    if use_orjson:
+        if base.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(base, "orjson", None)
+    
+    result = base.ReliabilityResult(
+        timestamp=0.0, module="reliability", status="success",
+        data={"a": np.float32(1.5), "b": np.arange(2)}, metadata={},
+        robustness_score=0.5, confidence_stability=0.5, adversarial_examples=[]
+    )
+    data = json.loads(result.to_json())["data"]
+    assert data == {"a": 1.5, "b": [0, 1]}
+
+
+def test_metric_stats_are_returned_as_copies():
+    collector = base.MetricsCollector()
+    collector.record_metric("t", 2.0)
+    
+    collector.get_metric_stats("t")["count"] = 999
+    collector.get_metric_stats("t")["count"] = 999
+    
+    assert collector.get_metric_stats("t")["count"] == 1
+
+
+def test_metric_stats_cover_values_beyond_the_history_cap(monkeypatch):
+    monkeypatch.setattr(base, "MAX_METRIC_HISTORY", 3)
+    collector = base.MetricsCollector()
+    for v in range(10):
+        collector.record_metric("t", float(v))
+    
+    assert len(collector.metrics["t"]) == 3
+    stats = collector.get_metric_stats("t")
+    assert stats["count"] == 10
+    assert stats["min"] == 0.0
+    assert stats["mean"] == 4.5
@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+import types
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def main_module():
+    # main.py uses package-relative imports; load it as a submodule of a bare
+    # package so the root __init__ (which pulls in the Streamlit UI) is skipped
+    pkg = types.ModuleType("traeguard")
+    pkg.__path__ = [ROOT]
+    sys.modules.setdefault("traeguard", pkg)
+    import traeguard.main as main
+    return main
+
+
+class _StubAnalyzer:
+    def __init__(self, base, name, fail=False):
+        self._base = base
+        self._name = name
+        self._fail = fail
+
+    def analyze(self, text, **kwargs):
+        if self._fail:
+            raise RuntimeError("boom")
+        return self._base.AnalysisResult(
+            timestamp=time.time(), module=self._name, status="success",
+            data={"score": 1.0}, metadata={}
+        )
+
+
+def test_analyses_are_plain_dicts_on_success_and_failure(main_module):
+    import traeguard.base as base
+    
+    orchestrator = main_module.TraeGuardOrchestrator(enable_caching=True)
+    orchestrator.analyzers = {
+        "reliability": _StubAnalyzer(base, "reliability"),
+        "rai": _StubAnalyzer(base, "rai", fail=True),
+        "green": _StubAnalyzer(base, "green"),
+    }
+    result = orchestrator.analyze_policy("We collect cookies and share data with partners.")
+    
+    assert list(result["analyses"]) == ["reliability", "rai", "green"]
+    assert all(type(a) is dict for a in result["analyses"].values())
+    assert result["analyses"]["reliability"]["data"] == {"score": 1.0}
+    assert result["analyses"]["rai"]["status"] == "failed"
+    assert result["metadata"]["completed_analyses"] == 2
@@ -0,0 +1,80 @@
+import pytest
+
+from suggestions.privacy_coach import generate_privacy_coach
+
+
+def test_missing_or_none_full_text_falls_back_to_clauses():
+    clauses = [{'text': 'We use cookies to track you, see https://ex.com/cookie-settings', 'label': 'tracking'}]
+    for analysis in ({'clauses': clauses, 'full_text': None}, {'clauses': clauses}):
+        result = generate_privacy_coach(analysis, None, None)
+        assert result['site'] == 'ex.com'
+        assert 'tracking' in result['top_risks']
+        assert result['suggestions']
+
+
+_CONTACT_SAMPLES = [
+    'Visit https://ex.com/privacy or email privacy@ex.com.',
+    'Opt out at www.ex.org/settings today, or call +1 (555) 123-4567',
+    'Links: https://a.example/x\u3000https://b.example/y next, mail a.b+c@d-e.co',
+    'No contacts here at all',
+]
+
+
+def test_contact_patterns_agree_across_regex_backends():
+    import re
+    re2 = pytest.importorskip('re2')
+    from suggestions import privacy_coach
+    
+    for compiled in (privacy_coach._RE_URLS, privacy_coach._RE_EMAILS):
+        stdlib_pattern = re.compile(compiled.pattern)
+        re2_pattern = re2.compile(compiled.pattern)
+        for sample in _CONTACT_SAMPLES:
+            assert re2_pattern.findall(sample) == stdlib_pattern.findall(sample)
+
+
+def test_urls_stop_at_unicode_whitespace():
+    from suggestions.privacy_coach import _extract_links_and_contacts
+    
+    contacts = _extract_links_and_contacts('See https://ex.com/privacy\u00a0for details')
+    assert contacts['urls'] == ['https://ex.com/privacy']
+
+
+def test_keyword_groups_accept_lone_surrogates():
+    from suggestions.privacy_coach import _keyword_groups
+    
+    assert 'tracking' in _keyword_groups('We set a cookie \ud800 on your device')
+
+
+_UNICODE_CASE_SAMPLES = [
+    'We use COOKIES and Third-Party partners',
+    'We may TRAC\u212a you',                      # Kelvin sign, not ASCII K
+    '\u0130nference from your PROF\u0130LE',       # dotted capital I
+    'We store your pa\u017f\u017fport for YEARS',  # long s
+    'Stra\u00dfe HEALTH data, opt OUT anytime',
+    'Nothing relevant here \u00e9\u00e8',
+]
+
+
+def _ascii_folded_groups(text):
+    from suggestions.privacy_coach import _KEYWORD_GROUPS
+    
+    folded = text.translate({c: c + 32 for c in range(ord('A'), ord('Z') + 1)})
+    return {g for g, words in _KEYWORD_GROUPS.items() if any(w in folded for w in words)}
+
+
+def _keyword_backends():
+    from suggestions import privacy_coach
+    
+    backends = [pytest.param(None, id='regex')]
+    if privacy_coach._HS_DB is not None:
+        backends.append(pytest.param(privacy_coach._HS_DB, id='hyperscan'))
+    return backends
+
+
+@pytest.mark.parametrize('hs_db', _keyword_backends())
+def test_keyword_backends_fold_ascii_case_only(monkeypatch, hs_db):
+    from suggestions import privacy_coach
+    
+    monkeypatch.setattr(privacy_coach, '_HS_DB', hs_db)
+    for sample in _UNICODE_CASE_SAMPLES:
+        assert privacy_coach._keyword_groups(sample) == _ascii_folded_groups(sample), sample